@@ -6,12 +6,15 @@ import html
 import json
 import logging
 import os
+import re
+import string
 import threading
 import time
 
 import requests
 from PySide6.QtCore import (
     QDateTime,
+    QFile,
     QObject,
     QSettings,
     Qt,
@@ -30,6 +33,7 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSplitter,
     QTableWidget,
@@ -60,11 +64,58 @@ from scripts.compile_resources import compile_resources
 
 
 compile_resources()
+# Register the compiled icons and stylesheets with Qt
+import resources_rc  # noqa: E402,F401
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Branded widget stylesheets compiled into the Qt resources, filled in with the
+# $primary and $accent colors
+WIDGET_STYLESHEET_NAMES = (
+    "button",
+    "combo",
+    "line_edit",
+    "table",
+    "text_browser",
+    "dialog",
+)
+
+
+def _minify_stylesheet(stylesheet):
+    """Strip comments and layout whitespace that Qt would re-scan on every apply."""
+    stylesheet = re.sub(r"/\*.*?\*/", "", stylesheet, flags=re.DOTALL)
+    stylesheet = re.sub(r"\s+", " ", stylesheet)
+    return re.sub(r"\s*([{};])\s*|(:)\s+", r"\1\2", stylesheet).strip()
+
+
+def _load_stylesheet_template(name):
+    """Read a stylesheet template from the compiled Qt resources, minified."""
+    stylesheet_file = QFile(f":/styles/{name}.qss")
+    if not stylesheet_file.open(QFile.ReadOnly | QFile.Text):
+        raise FileNotFoundError(f"Stylesheet resource not found: {name}.qss")
+    try:
+        stylesheet = bytes(stylesheet_file.readAll()).decode("utf-8")
+    finally:
+        stylesheet_file.close()
+    return string.Template(_minify_stylesheet(stylesheet))
+
+
+WIDGET_STYLESHEET_TEMPLATES = {
+    name: _load_stylesheet_template(name) for name in WIDGET_STYLESHEET_NAMES
+}
+
+
+def _set_stylesheet(widget, stylesheet):
+    """Apply a stylesheet unless the widget already has it.
+
+    Qt re-parses the sheet and re-polishes the widget on every setStyleSheet
+    call, even when the text is unchanged.
+    """
+    if widget.styleSheet() != stylesheet:
+        widget.setStyleSheet(stylesheet)
+
 API_HEALTH_ENDPOINTS = [
     ("ProjectFlow Stage API", "https://stageapi.projectflow.ai/health"),
     ("RosieVision Dev API", "https://moapidev.rosievision.ai/health"),
@@ -290,6 +341,12 @@ class ApiHealthWorker(QObject):
 class MainWindow(QMainWindow):
     main_thread_signal = Signal(object)
 
+    # Rendered branded stylesheets, keyed by (primary, accent) color
+    _stylesheet_cache = {}
+
+    # Health check URLs are static, so every window shares one tuple
+    api_endpoints = tuple(url for _, url in API_HEALTH_ENDPOINTS)
+
     def __init__(self):
         super().__init__()
         self.main_thread_signal.connect(lambda f: f())
@@ -447,15 +504,8 @@ class MainWindow(QMainWindow):
             # Track health check threads and workers
             self.api_health_threads: List[QThread] = []
             self.api_health_workers: List[Any] = []
-
-            # Initialize API endpoints
-            self.api_endpoints = [
-                "https://stageapi.projectflow.ai/health",
-                "https://moapidev.rosievision.ai/health",
-                "https://moapistage.rosievision.ai/health",
-                "https://moapi.rosievision.ai/health",
-                "https://devapi.projectflow.ai/health",
-            ]
+            # Builds shown in each platform's builds table, by row
+            self._fetched_builds: Dict[str, List[Dict[str, Any]]] = {}
 
             # Initialize other attributes
             self.connections: List[Dict[str, Any]] = []
@@ -1397,21 +1447,26 @@ class MainWindow(QMainWindow):
             self.results_table.setColumnCount(len(columns))
             self.results_table.setRowCount(len(data))
             self.results_table.setHorizontalHeaderLabels(columns)
-            for i, row in enumerate(data):
-                for j, value in enumerate(row):
-                    if j == 3 and value:
-                        # Show plain text, pretty-print JSON if possible
-                        try:
-                            parsed = json.loads(value)
-                            pretty = json.dumps(parsed, indent=2)
-                            item = QTableWidgetItem(pretty)
-                        except Exception:
+            # Fill the whole table before letting it repaint or resize
+            self.results_table.setUpdatesEnabled(False)
+            try:
+                for i, row in enumerate(data):
+                    for j, value in enumerate(row):
+                        if j == 3 and value:
+                            # Show plain text, pretty-print JSON if possible
+                            try:
+                                parsed = json.loads(value)
+                                pretty = json.dumps(parsed, indent=2)
+                                item = QTableWidgetItem(pretty)
+                            except Exception:
+                                item = QTableWidgetItem(str(value))
+                        else:
                             item = QTableWidgetItem(str(value))
-                    else:
-                        item = QTableWidgetItem(str(value))
-                    self.results_table.setItem(i, j, item)
-            self.results_table.resizeColumnsToContents()
-            self.results_table.resizeRowsToContents()
+                        self.results_table.setItem(i, j, item)
+                self.results_table.resizeColumnsToContents()
+                self.results_table.resizeRowsToContents()
+            finally:
+                self.results_table.setUpdatesEnabled(True)
             self.append_terminal_line(f"Results displayed in table", msg_type="success")
         except Exception as e:
             self.append_terminal_line(
@@ -1419,12 +1474,7 @@ class MainWindow(QMainWindow):
             )
 
     def handle_refresh_builds(self, platform):
-        from PySide6.QtWidgets import (
-            QHeaderView,
-            QProgressBar,
-            QPushButton,
-            QTableWidgetItem,
-        )
+        from PySide6.QtWidgets import QHeaderView, QTableWidgetItem
 
         table = (
             self.android_builds_table
@@ -1436,45 +1486,53 @@ class MainWindow(QMainWindow):
                 f"Fetching {platform} builds...", msg_type="system"
             )
             builds_list = builds.fetch_builds(platform)
+            self._fetched_builds[platform] = builds_list
             table.setRowCount(len(builds_list))
-            for i, build in enumerate(builds_list):
-                # Populate all columns
-                table.setItem(i, 0, QTableWidgetItem(str(build.get("id", ""))))
-                table.setItem(i, 1, QTableWidgetItem(str(build.get("status", ""))))
-                table.setItem(i, 2, QTableWidgetItem(str(build.get("platform", ""))))
-                table.setItem(i, 3, QTableWidgetItem(str(build.get("profile", "N/A"))))
-                table.setItem(
-                    i, 4, QTableWidgetItem(str(build.get("app_version", "N/A")))
-                )
-                table.setItem(i, 5, QTableWidgetItem(str(build.get("build_url", ""))))
-                # Sanitize error message and set as plain text
-                error_msg = html.escape(str(build.get("error", "")))
-                error_item = QTableWidgetItem(error_msg)
-                table.setItem(i, 6, error_item)
-                fingerprint_full = str(build.get("fingerprint", "fp"))
-                fingerprint = (
-                    fingerprint_full[:7]
-                    if len(fingerprint_full) >= 7
-                    else fingerprint_full
-                )
-                table.setItem(i, 7, QTableWidgetItem(fingerprint))
-                table.setItem(
-                    i, 8, QTableWidgetItem(str(build.get("build_number", "N/A")))
+            # Fill the cells with the model's signals blocked and announce them
+            # with one dataChanged, instead of one per setItem call
+            model = table.model()
+            blocked = model.blockSignals(True)
+            try:
+                for i, build in enumerate(builds_list):
+                    # Populate all columns
+                    table.setItem(i, 0, QTableWidgetItem(str(build.get("id", ""))))
+                    table.setItem(i, 1, QTableWidgetItem(str(build.get("status", ""))))
+                    table.setItem(
+                        i, 2, QTableWidgetItem(str(build.get("platform", "")))
+                    )
+                    table.setItem(
+                        i, 3, QTableWidgetItem(str(build.get("profile", "N/A")))
+                    )
+                    table.setItem(
+                        i, 4, QTableWidgetItem(str(build.get("app_version", "N/A")))
+                    )
+                    table.setItem(
+                        i, 5, QTableWidgetItem(str(build.get("build_url", "")))
+                    )
+                    # Sanitize error message and set as plain text
+                    error_msg = html.escape(str(build.get("error", "")))
+                    error_item = QTableWidgetItem(error_msg)
+                    table.setItem(i, 6, error_item)
+                    fingerprint_full = str(build.get("fingerprint", "fp"))
+                    fingerprint = (
+                        fingerprint_full[:7]
+                        if len(fingerprint_full) >= 7
+                        else fingerprint_full
+                    )
+                    table.setItem(i, 7, QTableWidgetItem(fingerprint))
+                    table.setItem(
+                        i, 8, QTableWidgetItem(str(build.get("build_number", "N/A")))
+                    )
+                    # Push to Azure buttons find their build by row, so a button
+                    # left from the previous refresh already pushes this build
+                    if not isinstance(table.cellWidget(i, 9), QPushButton):
+                        table.setCellWidget(i, 9, self._make_push_button(platform, i))
+            finally:
+                model.blockSignals(blocked)
+            if builds_list:
+                model.dataChanged.emit(
+                    model.index(0, 0), model.index(len(builds_list) - 1, 8)
                 )
-                # Push to Azure button logic: now supports progress bar replacement
-                push_btn = QPushButton("Push to Azure")
-
-                def make_push_handler(row, b=build):
-                    def handler():
-                        progress_bar = QProgressBar()
-                        progress_bar.setRange(0, 100)
-                        table.setCellWidget(row, 9, progress_bar)
-                        self.handle_push_to_azure(b, platform, progress_bar, row)
-
-                    return handler
-
-                push_btn.clicked.connect(make_push_handler(i))
-                table.setCellWidget(i, 9, push_btn)
             # Set column resize modes again after populating rows
             header = table.horizontalHeader()
             for col in range(table.columnCount()):
@@ -1491,6 +1549,32 @@ class MainWindow(QMainWindow):
                 f"Error fetching {platform} builds: {e}", msg_type="error"
             )
 
+    def _make_push_button(self, platform, row):
+        """Create the Push to Azure button for a row of a builds table."""
+        push_btn = QPushButton("Push to Azure")
+        push_btn.setProperty("platform", platform)
+        push_btn.setProperty("row", row)
+        push_btn.clicked.connect(self._on_push_to_azure_clicked)
+        return push_btn
+
+    @Slot()
+    def _on_push_to_azure_clicked(self):
+        """Replace the clicked button with a progress bar and push its row's build."""
+        push_btn = self.sender()
+        platform = push_btn.property("platform")
+        row = push_btn.property("row")
+        table = (
+            self.android_builds_table
+            if platform == "android"
+            else self.ios_builds_table
+        )
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        table.setCellWidget(row, 9, progress_bar)
+        self.handle_push_to_azure(
+            self._fetched_builds[platform][row], platform, progress_bar, row
+        )
+
     def handle_push_to_azure(self, build, platform, progress_bar=None, row=None):
         """
         Downloads the build, saves it with the correct filename pattern, uploads to Azure, and updates the DB.
@@ -1571,13 +1655,7 @@ class MainWindow(QMainWindow):
                     os.rmdir(temp_dir)
                 if progress_bar and row is not None:
                     # Restore button if validation fails
-                    push_btn = QPushButton("Push to Azure")
-                    push_btn.clicked.connect(
-                        lambda: self.handle_push_to_azure(
-                            build, platform, progress_bar, row
-                        )
-                    )
-                    table.setCellWidget(row, 9, push_btn)
+                    table.setCellWidget(row, 9, self._make_push_button(platform, row))
                 return
             # Check required Azure env vars
             required_env = [
@@ -1601,13 +1679,7 @@ class MainWindow(QMainWindow):
                 if temp_dir and os.path.exists(temp_dir):
                     os.rmdir(temp_dir)
                 if progress_bar and row is not None:
-                    push_btn = QPushButton("Push to Azure")
-                    push_btn.clicked.connect(
-                        lambda: self.handle_push_to_azure(
-                            build, platform, progress_bar, row
-                        )
-                    )
-                    table.setCellWidget(row, 9, push_btn)
+                    table.setCellWidget(row, 9, self._make_push_button(platform, row))
                 return
             # Start upload in a QThread
             self.append_terminal_line(
@@ -1662,13 +1734,7 @@ class MainWindow(QMainWindow):
                     )
                 if progress_bar and row is not None:
                     # Restore button after completion
-                    push_btn = QPushButton("Push to Azure")
-                    push_btn.clicked.connect(
-                        lambda: self.handle_push_to_azure(
-                            build, platform, progress_bar, row
-                        )
-                    )
-                    table.setCellWidget(row, 9, push_btn)
+                    table.setCellWidget(row, 9, self._make_push_button(platform, row))
                 self.status_bar.clearMessage()
 
             self.upload_worker.finished.connect(on_finished)
@@ -1680,13 +1746,7 @@ class MainWindow(QMainWindow):
             if temp_dir and os.path.exists(temp_dir):
                 os.rmdir(temp_dir)
             if progress_bar and row is not None:
-                push_btn = QPushButton("Push to Azure")
-                push_btn.clicked.connect(
-                    lambda: self.handle_push_to_azure(
-                        build, platform, progress_bar, row
-                    )
-                )
-                table.setCellWidget(row, 9, push_btn)
+                table.setCellWidget(row, 9, self._make_push_button(platform, row))
 
     def show_download_url_dialog(self, url: str, modal=False):
         from PySide6.QtWidgets import (
@@ -1801,9 +1861,10 @@ class MainWindow(QMainWindow):
 
     def update_connection_combo(self):
         self.connection_combo.clear()
-        self.connection_combo.addItem("Select connection...")
-        for conn in self.connections:
-            self.connection_combo.addItem(conn.get("name", ""))
+        self.connection_combo.addItems(
+            ["Select connection..."]
+            + [conn.get("name", "") for conn in self.connections]
+        )
 
     def handle_connection_selected(self, index):
         # Prevent recursive triggers or invalid index
@@ -1987,6 +2048,7 @@ class MainWindow(QMainWindow):
 
     def update_all_widget_styles(self):
         brand_colors = get_current_brand_colors()
+        stylesheets = self._widget_stylesheets(brand_colors)
 
         # Update button styles
         for btn in [
@@ -1998,137 +2060,46 @@ class MainWindow(QMainWindow):
             self.fetch_logs_btn,
         ]:
             if btn:
-                btn.setStyleSheet(
-                    f"""
-                    QPushButton {{
-                        background-color: {brand_colors['primary']};
-                        color: white;
-                        border: none;
-                        padding: 8px 16px;
-                        border-radius: 4px;
-                        font-weight: bold;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {brand_colors['accent']};
-                    }}
-                    QPushButton:pressed {{
-                        background-color: {brand_colors['primary']};
-                    }}
-                """
-                )
+                _set_stylesheet(btn, stylesheets["button"])
 
         # Update log window
         self.update_log_styles()
 
         # Update QComboBox styles
-        combo_style = f"""
-            QComboBox {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid {brand_colors['primary']};
-                border-radius: 4px;
-                padding: 5px;
-                min-width: 6em;
-            }}
-            QComboBox:hover {{
-                border: 1px solid {brand_colors['accent']};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border: none;
-            }}
-        """
-        self.connection_combo.setStyleSheet(combo_style)
-        self.webapp_combo.setStyleSheet(combo_style)
+        _set_stylesheet(self.connection_combo, stylesheets["combo"])
+        _set_stylesheet(self.webapp_combo, stylesheets["combo"])
 
         # Update QLineEdit styles
-        line_edit_style = f"""
-            QLineEdit {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid {brand_colors['primary']};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QLineEdit:hover {{
-                border: 1px solid {brand_colors['accent']};
-            }}
-            QLineEdit:focus {{
-                border: 2px solid {brand_colors['accent']};
-            }}
-        """
         for widget in self.findChildren(QLineEdit):
-            widget.setStyleSheet(line_edit_style)
+            _set_stylesheet(widget, stylesheets["line_edit"])
 
         # Update QTableWidget styles
-        table_style = f"""
-            QTableWidget {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                gridline-color: {brand_colors['primary']};
-                border: 1px solid {brand_colors['primary']};
-                border-radius: 4px;
-            }}
-            QTableWidget::item {{
-                padding: 5px;
-            }}
-            QTableWidget::item:selected {{
-                background-color: {brand_colors['primary']};
-                color: #ffffff;
-            }}
-            QHeaderView::section {{
-                background-color: #1e1e1e;
-                color: #ffffff;
-                padding: 5px;
-                border: 1px solid {brand_colors['primary']};
-            }}
-            QHeaderView::section:hover {{
-                background-color: {brand_colors['accent']};
-            }}
-        """
         for widget in self.findChildren(QTableWidget):
-            widget.setStyleSheet(table_style)
+            _set_stylesheet(widget, stylesheets["table"])
 
         # Update QTextBrowser styles
-        text_browser_style = f"""
-            QTextBrowser {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid {brand_colors['primary']};
-                border-radius: 4px;
-                padding: 5px;
-            }}
-        """
         for widget in self.findChildren(QTextBrowser):
-            widget.setStyleSheet(text_browser_style)
+            _set_stylesheet(widget, stylesheets["text_browser"])
 
         # Update QDialog styles
-        dialog_style = f"""
-            QDialog {{
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }}
-            QLabel {{
-                color: #ffffff;
-            }}
-            QDialogButtonBox QPushButton {{
-                background-color: {brand_colors['primary']};
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-                padding: 5px 15px;
-                min-width: 80px;
-            }}
-            QDialogButtonBox QPushButton:hover {{
-                background-color: {brand_colors['accent']};
-            }}
-        """
         for widget in self.findChildren(QDialog):
-            widget.setStyleSheet(dialog_style)
+            _set_stylesheet(widget, stylesheets["dialog"])
+
+    def _widget_stylesheets(self, brand_colors):
+        """Return the branded widget stylesheets, rendering each palette once."""
+        key = (brand_colors["primary"], brand_colors["accent"])
+        stylesheets = self._stylesheet_cache.get(key)
+        if stylesheets is not None:
+            return stylesheets
+
+        stylesheets = {
+            name: template.substitute(
+                primary=brand_colors["primary"], accent=brand_colors["accent"]
+            )
+            for name, template in WIDGET_STYLESHEET_TEMPLATES.items()
+        }
+        self._stylesheet_cache[key] = stylesheets
+        return stylesheets
 
     def show_current_token_dialog(self):
         import os
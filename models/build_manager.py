@@ -4,7 +4,7 @@ Build manager for handling mobile builds.
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 from PySide6.QtCore import QObject, Signal, Slot
@@ -29,6 +29,8 @@ class BuildManager(QObject):
     def __init__(self, azure_service: AzureService):
         super().__init__()
         self._builds: Dict[str, List[Dict]] = {"android": [], "ios": []}
+        # Per platform: the builds list and the lowercased search text of each build
+        self._search_text_cache: Dict[str, Tuple[List[Dict], List[str]]] = {}
         self._download_dir = Path.home() / ".quantumops" / "downloads"
         self._download_dir.mkdir(parents=True, exist_ok=True)
         self._azure_service = azure_service
@@ -146,27 +148,17 @@ class BuildManager(QObject):
             if not builds:
                 return []
 
-            filtered_builds = builds.copy()
-
-            # Apply search filter
             search_text = filters.get("search", "").lower()
-            if search_text:
-                filtered_builds = [
-                    build
-                    for build in filtered_builds
-                    if any(
-                        search_text in str(value).lower() for value in build.values()
-                    )
-                ]
-
-            # Apply version filter
             version = filters.get("version", "")
-            if version:
-                filtered_builds = [
-                    build
-                    for build in filtered_builds
-                    if build.get("appVersion") == version
-                ]
+            texts = self._search_texts(platform, builds) if search_text else None
+
+            # Check the cheap version match before searching the build's text
+            filtered_builds = [
+                build
+                for i, build in enumerate(builds)
+                if (not version or build.get("appVersion") == version)
+                and (not search_text or search_text in texts[i])
+            ]
 
             # Emit updated list
             self.build_list_updated.emit(filtered_builds)
@@ -177,6 +169,23 @@ class BuildManager(QObject):
             self.error_occurred.emit(str(e))
             raise
 
+    def _search_texts(self, platform: str, builds: List[Dict]) -> List[str]:
+        """Return the lowercased values of each build, joined for substring search.
+
+        The texts are built once per fetched builds list, so typing in the search
+        box only runs one substring check per build.
+        """
+        cached = self._search_text_cache.get(platform)
+        if cached is None or cached[0] is not builds:
+            # NUL cannot be typed into the search box, so matches never span values
+            texts = [
+                "\0".join(str(value) for value in build.values()).lower()
+                for build in builds
+            ]
+            cached = (builds, texts)
+            self._search_text_cache[platform] = cached
+        return cached[1]
+
     def update_build_status(self, build_id: str, platform: str, status: str):
         """Update the status of a specific build and emit signal."""
         try:
@@ -185,6 +194,7 @@ class BuildManager(QObject):
             )
             if build:
                 build["status"] = status
+                self._search_text_cache.pop(platform, None)
                 self.build_status_changed.emit(build_id, status)
         except Exception as e:
             logger.error(f"Error updating build status: {e}")
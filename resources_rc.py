@@ -6,6 +6,132 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
+\x00\x00\x00\xf1\
+Q\
+LineEdit {\x0a    b\
+ackground-color:\
+ #2b2b2b;\x0a    co\
+lor: #ffffff;\x0a  \
+  border: 1px so\
+lid $primary;\x0a  \
+  border-radius:\
+ 4px;\x0a    paddin\
+g: 5px;\x0a}\x0aQLineE\
+dit:hover {\x0a    \
+border: 1px soli\
+d $accent;\x0a}\x0aQLi\
+neEdit:focus {\x0a \
+   border: 2px s\
+olid $accent;\x0a}\x0a\
+\
+\x00\x00\x01\x07\
+Q\
+PushButton {\x0a   \
+ background-colo\
+r: $primary;\x0a   \
+ color: white;\x0a \
+   border: none;\
+\x0a    padding: 8p\
+x 16px;\x0a    bord\
+er-radius: 4px;\x0a\
+    font-weight:\
+ bold;\x0a}\x0aQPushBu\
+tton:hover {\x0a   \
+ background-colo\
+r: $accent;\x0a}\x0aQP\
+ushButton:presse\
+d {\x0a    backgrou\
+nd-color: $prima\
+ry;\x0a}\x0a\
+\x00\x00\x00\x8e\
+Q\
+TextBrowser {\x0a  \
+  background-col\
+or: #2b2b2b;\x0a   \
+ color: #ffffff;\
+\x0a    border: 1px\
+ solid $primary;\
+\x0a    border-radi\
+us: 4px;\x0a    pad\
+ding: 5px;\x0a}\x0a\
+\x00\x00\x01O\
+Q\
+Dialog {\x0a    bac\
+kground-color: #\
+2b2b2b;\x0a    colo\
+r: #ffffff;\x0a}\x0aQL\
+abel {\x0a    color\
+: #ffffff;\x0a}\x0aQDi\
+alogButtonBox QP\
+ushButton {\x0a    \
+background-color\
+: $primary;\x0a    \
+color: #ffffff;\x0a\
+    border: none\
+;\x0a    border-rad\
+ius: 4px;\x0a    pa\
+dding: 5px 15px;\
+\x0a    min-width: \
+80px;\x0a}\x0aQDialogB\
+uttonBox QPushBu\
+tton:hover {\x0a   \
+ background-colo\
+r: $accent;\x0a}\x0a\
+\x00\x00\x01\xd3\
+Q\
+TableWidget {\x0a  \
+  background-col\
+or: #2b2b2b;\x0a   \
+ color: #ffffff;\
+\x0a    gridline-co\
+lor: $primary;\x0a \
+   border: 1px s\
+olid $primary;\x0a \
+   border-radius\
+: 4px;\x0a}\x0aQTableW\
+idget::item {\x0a  \
+  padding: 5px;\x0a\
+}\x0aQTableWidget::\
+item:selected {\x0a\
+    background-c\
+olor: $primary;\x0a\
+    color: #ffff\
+ff;\x0a}\x0aQHeaderVie\
+w::section {\x0a   \
+ background-colo\
+r: #1e1e1e;\x0a    \
+color: #ffffff;\x0a\
+    padding: 5px\
+;\x0a    border: 1p\
+x solid $primary\
+;\x0a}\x0aQHeaderView:\
+:section:hover {\
+\x0a    background-\
+color: $accent;\x0a\
+}\x0a\
+\x00\x00\x01K\
+Q\
+ComboBox {\x0a    b\
+ackground-color:\
+ #2b2b2b;\x0a    co\
+lor: #ffffff;\x0a  \
+  border: 1px so\
+lid $primary;\x0a  \
+  border-radius:\
+ 4px;\x0a    paddin\
+g: 5px;\x0a    min-\
+width: 6em;\x0a}\x0aQC\
+omboBox:hover {\x0a\
+    border: 1px \
+solid $accent;\x0a}\
+\x0aQComboBox::drop\
+-down {\x0a    bord\
+er: none;\x0a    wi\
+dth: 20px;\x0a}\x0aQCo\
+mboBox::down-arr\
+ow {\x0a    image: \
+none;\x0a    border\
+: none;\x0a}\x0a\
 \x00\x00\x01,\
 <\
 svg xmlns=\x22http:\
@@ -55,6 +181,34 @@ qt_resource_name = b"\
 \x00o\xa6S\
 \x00i\
 \x00c\x00o\x00n\x00s\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00s\
+\x00t\x00y\x00l\x00e\x00s\
+\x00\x0d\
+\x0d\x0e2\x03\
+\x00l\
+\x00i\x00n\x00e\x00_\x00e\x00d\x00i\x00t\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x0bla\xc3\
+\x00b\
+\x00u\x00t\x00t\x00o\x00n\x00.\x00q\x00s\x00s\
+\x00\x10\
+\x0dh\xc6\x83\
+\x00t\
+\x00e\x00x\x00t\x00_\x00b\x00r\x00o\x00w\x00s\x00e\x00r\x00.\x00q\x00s\x00s\
+\x00\x0a\
+\x03W\x07\xa3\
+\x00d\
+\x00i\x00a\x00l\x00o\x00g\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x09(\xacC\
+\x00t\
+\x00a\x00b\x00l\x00e\x00.\x00q\x00s\x00s\
+\x00\x09\
+\x03\x92\x8cc\
+\x00c\
+\x00o\x00m\x00b\x00o\x00.\x00q\x00s\x00s\
 \x00\x0a\
 \x05x\xd4\xa7\
 \x00u\
@@ -66,13 +220,27 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x09\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x06\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x02\x92\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x05\xbc\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x03\xe5\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00B\x00\x00\x00\x00\x00\x01\x00\x00\x00\xf5\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x02\x00\
+\x00\x00\x01\xa1G\xfe\x9c\x94\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x07\x0b\
 \x00\x00\x01\x97\x8f\x8f\x96\xa1\
-\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x010\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x08;\
 \x00\x00\x01\x97\x8f\x8fZ'\
 "
 
@@ -1,10 +1,13 @@
 import os
 import sys
 import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 from PySide6.QtCore import QSettings
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 
 # Add the project root directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -21,6 +24,45 @@ def qapp():
         yield QApplication.instance()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def azure_env():
+    """Set the Azure environment variables once for the whole session."""
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setenv("AZURE_STORAGE_ACCOUNT", "testaccount")
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def repo_files():
+    """Relative paths of the entries at the top level, in config/ and in tests/."""
+    names = set()
+    for prefix in ("", "config/", "tests/"):
+        with os.scandir(prefix or ".") as entries:
+            names.update(prefix + entry.name for entry in entries)
+    return frozenset(names)
+
+
+@pytest.fixture(scope="session")
+def project_files(repo_files):
+    """Contents of the version and documentation files that exist, read once."""
+    return {
+        name: Path(name).read_text(encoding="utf-8")
+        for name in ("config/version.txt", "setup.py", "README.md")
+        if name in repo_files
+    }
+
+
+@pytest.fixture(autouse=True)
+def qmb(monkeypatch):
+    """Replace the modal QMessageBox helpers with Mocks for every test."""
+    mocks = SimpleNamespace(critical=Mock(), about=Mock(), information=Mock())
+    monkeypatch.setattr(QMessageBox, "critical", mocks.critical)
+    monkeypatch.setattr(QMessageBox, "about", mocks.about)
+    monkeypatch.setattr(QMessageBox, "information", mocks.information)
+    yield mocks
+
+
 @pytest.fixture
 def temp_settings():
     """Create temporary settings for testing."""
@@ -1,257 +1,220 @@
 """
 Unit tests for BuildController.
 """
-from unittest.mock import Mock, patch
+from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
 from controllers.build_controller import BuildController
-from models.build_manager import BuildManager
-from services.azure_service import AzureServiceError
 
 
-@pytest.fixture
-def build_manager():
-    """Create a BuildManager instance for testing."""
-    return Mock(spec=BuildManager)
+class FakeBuildView:
+    """Lightweight stand-in for BuildView exposing only what the controller uses."""
+
+    __slots__ = (
+        "platform",
+        "fetch_requested",
+        "download_requested",
+        "push_to_azure_requested",
+        "update_builds",
+        "update_build_status",
+        "show_error",
+        "show_loading",
+        "show_download_progress",
+        "update_download_progress",
+        "hide_download_progress",
+    )
 
+    def __init__(self, platform: str = "android"):
+        self.platform = platform
+        for name in self.__slots__[1:]:
+            setattr(self, name, Mock())
+
+
+class FakeBuildManager:
+    """Minimal BuildManager stand-in exposing only what the controller uses."""
+
+    __slots__ = (
+        "_download_dir",
+        "builds_fetched",
+        "build_downloaded",
+        "build_uploaded",
+        "build_status_changed",
+        "error_occurred",
+        "fetch_builds",
+        "download_build",
+        "push_to_azure",
+        "update_build_status",
+        "filter_builds",
+        "_find_build",
+        "_get_filename",
+    )
 
-@pytest.fixture
-def build_controller(build_manager):
-    """Create a BuildController instance for testing."""
-    controller = BuildController(build_manager)
-    return controller
+    def __init__(self, download_dir: Path):
+        self._download_dir = download_dir
+        for name in self.__slots__[1:]:
+            setattr(self, name, Mock())
 
 
-@pytest.fixture
-def mock_progress_dialog():
-    """Create a mock ProgressDialog."""
-    with patch("quantumops.controllers.build_controller.ProgressDialog") as mock:
-        yield mock
+@pytest.fixture(scope="session")
+def build_files(tmp_path_factory):
+    """Create a download directory holding an already downloaded build."""
+    download_dir = tmp_path_factory.mktemp("builds")
+    (download_dir / "test-build.apk").touch()
+    return download_dir
 
 
 @pytest.fixture
-def mock_message_box():
-    """Create a mock QMessageBox."""
-    with patch("quantumops.controllers.build_controller.QMessageBox") as mock:
-        yield mock
-
-
-def test_initialize_azure_success(build_controller, build_manager):
-    """Test successful Azure initialization."""
-    # Arrange
-    container_name = "test-container"
-
-    # Act
-    build_controller.initialize_azure(container_name)
-
-    # Assert
-    build_manager.initialize_azure.assert_called_once_with(container_name)
-
+def build_manager(build_files):
+    """Create a BuildManager instance for testing."""
+    return FakeBuildManager(build_files)
 
-def test_initialize_azure_error(build_controller, build_manager, mock_message_box):
-    """Test Azure initialization error."""
-    # Arrange
-    container_name = "test-container"
-    error_msg = "Azure error"
-    build_manager.initialize_azure.side_effect = AzureServiceError(error_msg)
 
-    # Act
-    build_controller.initialize_azure(container_name)
+@pytest.fixture
+def build_view(request):
+    """Create a fake BuildView for the requested platform, android by default."""
+    return FakeBuildView(getattr(request, "param", "android"))
 
-    # Assert
-    mock_message_box.critical.assert_called_once()
-    assert error_msg in str(mock_message_box.critical.call_args[0][2])
 
+@pytest.fixture
+def build_controller(build_manager, build_view):
+    """Create a BuildController instance for testing."""
+    controller = BuildController(build_manager, build_view)
+    return controller
 
-def test_fetch_builds_success(build_controller, build_manager, mock_progress_dialog):
-    """Test successful build fetching."""
-    # Arrange
-    platform = "android"
-    builds = [{"id": "build1"}, {"id": "build2"}]
-    build_manager.fetch_builds.return_value = builds
 
+@pytest.mark.parametrize("build_view", ["android", "ios"], indirect=True)
+def test_fetch_builds(build_controller, build_manager, build_view):
+    """Test fetching builds shows the loading state and asks the model."""
     # Act
-    build_controller.fetch_builds(platform)
+    build_controller.fetch_builds()
 
     # Assert
-    build_manager.fetch_builds.assert_called_once()
-    mock_progress_dialog.assert_called_once()
-    mock_progress_dialog.return_value.close.assert_called_once()
+    build_view.show_loading.assert_called_once()
+    build_manager.fetch_builds.assert_called_once_with(build_view.platform)
 
 
-def test_fetch_builds_error(
-    build_controller, build_manager, mock_progress_dialog, mock_message_box
-):
-    """Test fetch builds with error."""
+def test_download_build(build_controller, build_manager, build_view):
+    """Test downloading a build reports progress to the view."""
     # Arrange
-    platform = "android"
-    error_msg = "Azure error"
-    build_manager.fetch_builds.side_effect = AzureServiceError(error_msg)
+    build_id = "test-build"
 
     # Act
-    build_controller.fetch_builds(platform)
+    build_controller.download_build(build_id)
 
     # Assert
-    mock_message_box.critical.assert_called_once()
-    assert error_msg in str(mock_message_box.critical.call_args[0][2])
-    mock_progress_dialog.return_value.close.assert_called_once()
+    build_view.show_download_progress.assert_called_once_with(build_id)
+    build_manager.download_build.assert_called_once_with(
+        build_id, build_view.platform, build_view.update_download_progress
+    )
 
 
-def test_download_build_success(
-    build_controller, build_manager, mock_progress_dialog, mock_message_box
-):
-    """Test successful build download."""
+def test_build_downloaded(build_controller, build_manager, build_view, qmb):
+    """Test a finished download updates the view and the build status."""
     # Arrange
     build_id = "test-build"
-    platform = "android"
     local_path = "/path/to/download.apk"
-    build_manager.download_build.return_value = local_path
 
     # Act
-    build_controller.download_build(build_id, platform)
+    build_controller._on_build_downloaded(build_id, local_path)
 
     # Assert
-    build_manager.download_build.assert_called_once()
-    mock_progress_dialog.assert_called_once()
-    mock_progress_dialog.return_value.close.assert_called_once()
-    mock_message_box.information.assert_called_once()
-    assert local_path in str(mock_message_box.information.call_args[0][2])
+    build_view.hide_download_progress.assert_called_once_with(build_id)
+    qmb.information.assert_called_once()
+    assert local_path in qmb.information.call_args[0][2]
+    build_manager.update_build_status.assert_called_once_with(
+        build_id, build_view.platform, "Downloaded"
+    )
+    build_manager.push_to_azure.assert_not_called()
 
 
-def test_download_build_error(
-    build_controller, build_manager, mock_progress_dialog, mock_message_box
-):
-    """Test download build with error."""
+def test_build_downloaded_for_push(build_controller, build_manager, build_view):
+    """Test a download started by a push request is uploaded afterwards."""
     # Arrange
     build_id = "test-build"
-    platform = "android"
-    error_msg = "Azure error"
-    build_manager.download_build.side_effect = AzureServiceError(error_msg)
+    local_path = "/path/to/download.apk"
+    build_controller._upload_after_download_queue.add(build_id)
 
     # Act
-    build_controller.download_build(build_id, platform)
+    build_controller._on_build_downloaded(build_id, local_path)
 
     # Assert
-    mock_message_box.critical.assert_called_once()
-    assert error_msg in str(mock_message_box.critical.call_args[0][2])
-    mock_progress_dialog.return_value.close.assert_called_once()
+    build_manager.push_to_azure.assert_called_once_with(
+        build_id, build_view.platform, local_path
+    )
+    assert build_id not in build_controller._upload_after_download_queue
 
 
-def test_upload_build_success(
-    build_controller, build_manager, mock_progress_dialog, mock_message_box
-):
-    """Test successful build upload."""
+def test_build_uploaded(build_controller, build_manager, build_view, qmb):
+    """Test a finished upload updates the build status and reports the URL."""
     # Arrange
     build_id = "test-build"
-    platform = "android"
-    local_path = "/path/to/build.apk"
     blob_url = "https://storage.blob.core.windows.net/test-container/test-build.apk"
-    build_manager.upload_build.return_value = blob_url
-
-    # Act
-    build_controller.upload_build(build_id, local_path, platform)
-
-    # Assert
-    build_manager.upload_build.assert_called_once()
-    mock_progress_dialog.assert_called_once()
-    mock_progress_dialog.return_value.close.assert_called_once()
-    mock_message_box.information.assert_called_once()
-    assert blob_url in str(mock_message_box.information.call_args[0][2])
-
-
-def test_upload_build_error(
-    build_controller, build_manager, mock_progress_dialog, mock_message_box
-):
-    """Test upload build with error."""
-    # Arrange
-    build_id = "test-build"
-    platform = "android"
-    local_path = "/path/to/build.apk"
-    error_msg = "Azure error"
-    build_manager.upload_build.side_effect = AzureServiceError(error_msg)
+    messages = []
+    build_controller.error_occurred.connect(messages.append)
 
     # Act
-    build_controller.upload_build(build_id, local_path, platform)
+    build_controller._on_build_uploaded(build_id, blob_url)
 
     # Assert
-    mock_message_box.critical.assert_called_once()
-    assert error_msg in str(mock_message_box.critical.call_args[0][2])
-    mock_progress_dialog.return_value.close.assert_called_once()
-
-
-def test_filter_builds_success(build_controller, build_manager):
-    """Test successful build filtering."""
-    # Arrange
-    platform = "android"
-    filters = {"version": "1.0"}
-    filtered_builds = [{"id": "build1", "version": "1.0"}]
-    build_manager.filter_builds.return_value = filtered_builds
-
-    # Act
-    result = build_controller.filter_builds(platform, filters)
-
-    # Assert
-    build_manager.filter_builds.assert_called_once_with(platform, filters)
-    assert result == filtered_builds
+    qmb.information.assert_called_once()
+    build_manager.update_build_status.assert_called_once_with(
+        build_id, build_view.platform, "Uploaded"
+    )
+    assert messages == [f"Build {build_id} uploaded to: {blob_url}"]
 
 
-def test_filter_builds_error(build_controller, build_manager, mock_message_box):
-    """Test filter builds with error."""
+def test_push_to_azure_unknown_build(build_controller, build_manager):
+    """Test pushing a build the model does not know reports an error."""
     # Arrange
-    platform = "android"
-    filters = {"version": "1.0"}
-    error_msg = "Filter error"
-    build_manager.filter_builds.side_effect = Exception(error_msg)
+    build_manager._find_build.return_value = None
+    messages = []
+    build_controller.error_occurred.connect(messages.append)
 
     # Act
-    result = build_controller.filter_builds(platform, filters)
+    build_controller._on_push_to_azure_requested("missing-build")
 
     # Assert
-    mock_message_box.critical.assert_called_once()
-    assert error_msg in str(mock_message_box.critical.call_args[0][2])
-    assert result == []
+    assert messages == ["Build missing-build not found."]
+    build_manager.push_to_azure.assert_not_called()
 
 
-def test_progress_callback(build_controller, mock_progress_dialog):
-    """Test progress callback updates dialog."""
+def test_push_to_azure_downloads_first(
+    build_controller, build_manager, build_view, qmb
+):
+    """Test pushing a build that is not on disk downloads it first."""
     # Arrange
-    progress = 50
-    status = "Processing..."
+    build_id = "new-build"
+    build_manager._find_build.return_value = {"id": build_id}
+    build_manager._get_filename.return_value = "new-build.apk"
 
     # Act
-    build_controller._show_progress("Test", "Initializing...")
-    if build_controller._progress_dialog:
-        build_controller._progress_dialog.set_progress(progress, status)
+    build_controller._on_push_to_azure_requested(build_id)
 
     # Assert
-    mock_progress_dialog.assert_called_once()
-    mock_progress_dialog.return_value.set_progress.assert_called_once_with(
-        progress, status
+    assert build_id in build_controller._upload_after_download_queue
+    build_manager.download_build.assert_called_once_with(
+        build_id, build_view.platform, build_view.update_download_progress
     )
+    qmb.information.assert_called_once()
+    build_manager.push_to_azure.assert_not_called()
 
 
-def test_hide_progress(build_controller, mock_progress_dialog):
-    """Test hiding progress dialog."""
-    # Arrange
-    build_controller._show_progress("Test", "Initializing...")
-
-    # Act
-    build_controller._hide_progress()
-
-    # Assert
-    mock_progress_dialog.return_value.close.assert_called_once()
-    assert build_controller._progress_dialog is None
-
-
-def test_show_error(build_controller, mock_message_box):
-    """Test showing error message."""
+@pytest.mark.parametrize("build_view", ["android", "ios"], indirect=True)
+def test_push_to_azure_downloaded_build(
+    build_controller, build_manager, build_view, build_files
+):
+    """Test pushing an already downloaded build uploads it directly."""
     # Arrange
-    title = "Error"
-    message = "Test error"
+    build_id = "test-build"
+    build_manager._find_build.return_value = {"id": build_id}
+    build_manager._get_filename.return_value = "test-build.apk"
 
     # Act
-    build_controller._show_error(title, message)
+    build_controller._on_push_to_azure_requested(build_id)
 
     # Assert
-    mock_message_box.critical.assert_called_once_with(None, title, message)
+    build_manager.push_to_azure.assert_called_once_with(
+        build_id, build_view.platform, str(build_files / "test-build.apk")
+    )
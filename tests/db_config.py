@@ -1,11 +1,15 @@
 """Test database configuration."""
 import os
 
+# Give each pytest-xdist worker its own database so workers never share state
+_DB_NAME = os.getenv("TEST_DB_NAME", "test_db")
+_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
 # Database connection settings
 DB_CONFIG = {
     "host": os.getenv("TEST_DB_HOST", "localhost"),
     "port": os.getenv("TEST_DB_PORT", "5432"),
-    "database": os.getenv("TEST_DB_NAME", "test_db"),
+    "database": f"{_DB_NAME}_{_WORKER}" if _WORKER else _DB_NAME,
     "username": os.getenv("TEST_DB_USER", "postgres"),
     "password": os.getenv("TEST_DB_PASSWORD", "postgres"),
     "default_table": os.getenv("TEST_DB_TABLE", "test_table"),
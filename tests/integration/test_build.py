@@ -1,7 +1,10 @@
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+from tests.workflow_utils import WORKFLOW_SECTION_PATTERN, WORKFLOW_SECTIONS
+
 
 def test_build_script():
     """Test that the build script runs without errors."""
@@ -15,7 +18,7 @@ def test_build_script():
 
     # Check that the executable was created
     dist_dir = Path("dist")
-    assert dist_dir.exists(), "dist directory not created"
+    assert os.access(dist_dir, os.F_OK), "dist directory not created"
 
     # Check for executable files
     executables = list(dist_dir.glob("QuantumOps*")) + list(
@@ -24,14 +27,12 @@ def test_build_script():
     assert len(executables) > 0, "No executables found in dist directory"
 
 
-def test_version_file():
+def test_version_file(project_files):
     """Test that the version file exists and contains a valid version number."""
-    version_file = Path("version.txt")
-    assert version_file.exists(), "version.txt not found"
+    assert "config/version.txt" in project_files, "config/version.txt not found"
 
     # Read version number
-    with open(version_file) as f:
-        version = f.read().strip()
+    version = project_files["config/version.txt"].strip()
 
     # Check version format (e.g., "1.0.0")
     assert len(version.split(".")) == 3, "Invalid version format"
@@ -40,14 +41,13 @@ def test_version_file():
     ), "Version parts must be numbers"
 
 
-def test_requirements_file():
+def test_requirements_file(repo_files):
     """Test that the requirements file exists and contains all necessary packages."""
     requirements_file = Path("requirements.txt")
-    assert requirements_file.exists(), "requirements.txt not found"
+    assert "requirements.txt" in repo_files, "requirements.txt not found"
 
     # Read requirements
-    with open(requirements_file) as f:
-        requirements = f.read().splitlines()
+    requirements = requirements_file.read_text(encoding="utf-8").splitlines()
 
     # Check for required packages
     required_packages = {
@@ -65,16 +65,12 @@ def test_requirements_file():
 def test_github_workflow():
     """Test that the GitHub workflow file exists and is valid."""
     workflow_file = Path(".github/workflows/build.yml")
-    assert workflow_file.exists(), "GitHub workflow file not found"
+    assert os.access(workflow_file, os.F_OK), "GitHub workflow file not found"
 
     # Read workflow file
-    with open(workflow_file) as f:
-        workflow = f.read()
+    workflow = workflow_file.read_text(encoding="utf-8")
 
     # Check for required sections
-    assert "name: Build QuantumOps" in workflow
-    assert "on:" in workflow
-    assert "jobs:" in workflow
-    assert "build:" in workflow
-    assert "Build on ${{ matrix.os }}" in workflow
-    assert "pyinstaller quantumops.spec" in workflow
+    found = set(WORKFLOW_SECTION_PATTERN.findall(workflow))
+    missing = [section for section in WORKFLOW_SECTIONS if section not in found]
+    assert not missing, f"Workflow is missing {missing}"
@@ -1,8 +1,14 @@
-import psycopg2
+import psycopg
 import pytest
 
 from tests.db_config import DB_CONFIG
-from utils import create_test_database, drop_test_database, get_test_connection
+from tests.utils import (
+    create_test_database,
+    drop_test_database,
+    get_test_connection,
+    release_test_connection,
+    truncate_test_tables,
+)
 
 
 @pytest.fixture(scope="session")
@@ -18,12 +24,18 @@ def db_connection(test_db):
     """Create a connection to the test database."""
     conn = get_test_connection()
     yield conn
-    conn.close()
+    release_test_connection(conn)
+
+
+@pytest.fixture(autouse=True)
+def clean_tables(db_connection):
+    """Empty the test table before each test."""
+    truncate_test_tables(db_connection)
 
 
 def test_database_connection(db_connection):
     """Test that we can connect to the database."""
-    assert db_connection.status == 1  # Connection is open
+    assert not db_connection.closed  # Connection is open
 
 
 def test_table_creation(db_connection):
@@ -72,6 +84,6 @@ def test_insert_and_query(db_connection):
 def test_error_handling(db_connection):
     """Test error handling for invalid queries."""
     cur = db_connection.cursor()
-    with pytest.raises(psycopg2.Error):
+    with pytest.raises(psycopg.Error):
         cur.execute("SELECT * FROM non_existent_table")
     cur.close()
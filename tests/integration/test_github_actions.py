@@ -1,39 +1,39 @@
+import os
 from pathlib import Path
 
+import pytest
+
+from tests.workflow_utils import WORKFLOW_SECTION_PATTERN, WORKFLOW_SECTIONS
+
+WORKFLOW_FILE = Path(".github/workflows/build.yml")
+
+
+@pytest.fixture(scope="module")
+def workflow():
+    """Read the workflow file once for the tests that inspect its contents."""
+    return WORKFLOW_FILE.read_text(encoding="utf-8")
+
 
 def test_workflow_file_exists():
     """Test that the GitHub workflow file exists."""
-    workflow_file = Path(".github/workflows/build.yml")
-    assert workflow_file.exists(), "GitHub workflow file not found"
+    assert os.access(WORKFLOW_FILE, os.F_OK), "GitHub workflow file not found"
 
 
-def test_workflow_structure():
+def test_workflow_structure(workflow):
     """Test that the GitHub workflow has the correct structure."""
-    workflow_file = Path(".github/workflows/build.yml")
-    with open(workflow_file) as f:
-        workflow = f.read()
-    assert "name: Build QuantumOps" in workflow
-    assert "on:" in workflow
-    assert "jobs:" in workflow
-    assert "build:" in workflow
-    assert "Build on ${{ matrix.os }}" in workflow
-    assert "pyinstaller quantumops.spec" in workflow
-
-
-def test_workflow_dependencies():
+    found = set(WORKFLOW_SECTION_PATTERN.findall(workflow))
+    missing = [section for section in WORKFLOW_SECTIONS if section not in found]
+    assert not missing, f"Workflow is missing {missing}"
+
+
+def test_workflow_dependencies(workflow):
     """Test that the GitHub workflow installs all necessary dependencies."""
-    workflow_file = Path(".github/workflows/build.yml")
-    with open(workflow_file) as f:
-        workflow = f.read()
     assert "pip install -r requirements.txt" in workflow
     assert "pip install pyinstaller" in workflow
 
 
-def test_workflow_artifacts():
+def test_workflow_artifacts(workflow):
     """Test that the GitHub workflow uploads the correct artifacts."""
-    workflow_file = Path(".github/workflows/build.yml")
-    with open(workflow_file) as f:
-        workflow = f.read()
     assert "actions/upload-artifact@v4" in workflow
     assert (
         "dist/QuantumOps*" in workflow or "dist/RosieVision-Error-Browser*" in workflow
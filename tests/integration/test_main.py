@@ -1,10 +1,6 @@
-import os
-import sys
-
-import psycopg2
+import psycopg
 import pytest
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication
 
 from tests.db_config import DB_CONFIG
 
@@ -22,27 +18,23 @@ TEST_CONN = {
 @pytest.fixture(scope="function", autouse=True)
 def setup_test_table():
     """Ensure the test table exists with the correct schema before each test."""
-    conn = psycopg2.connect(
+    with psycopg.connect(
         host=DB_CONFIG["host"],
         port=DB_CONFIG["port"],
         dbname=DB_CONFIG["database"],
         user=DB_CONFIG["username"],
         password=DB_CONFIG["password"],
-    )
-    cur = conn.cursor()
-    cur.execute(
-        f"""
-        CREATE TABLE IF NOT EXISTS {DB_CONFIG['default_table']} (
-            id SERIAL PRIMARY KEY,
-            type VARCHAR(50),
-            message TEXT,
-            details TEXT
+    ) as conn:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {DB_CONFIG['default_table']} (
+                id SERIAL PRIMARY KEY,
+                type VARCHAR(50),
+                message TEXT,
+                details TEXT
+            )
+        """
         )
-    """
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
 
 
 @pytest.fixture(autouse=True)
@@ -53,19 +45,6 @@ def close_app_conn(app):
         app.conn = None
 
 
-@pytest.fixture(scope="session")
-def qapp():
-    """Create a QApplication instance for testing."""
-    if QApplication.instance() is None:
-        app = QApplication(sys.argv)
-        # Set environment variable to indicate we're running in a test environment
-        os.environ["QT_QPA_PLATFORM"] = "offscreen"
-        yield app
-        app.quit()
-    else:
-        yield QApplication.instance()
-
-
 @pytest.fixture
 def app(qapp):
     """Create a DatabaseApp instance for testing."""
@@ -100,20 +79,16 @@ def test_database_connection(app, qtbot):
 def test_query_execution(app, qtbot):
     """Test executing a query after connecting to the database."""
     # Insert a test row into the table before querying
-    conn = psycopg2.connect(
+    with psycopg.connect(
         host=DB_CONFIG["host"],
         port=DB_CONFIG["port"],
         dbname=DB_CONFIG["database"],
         user=DB_CONFIG["username"],
         password=DB_CONFIG["password"],
-    )
-    cur = conn.cursor()
-    cur.execute(
-        f"INSERT INTO {DB_CONFIG['default_table']}(type, message, details) VALUES ('test', 'test message', 'test details')"
-    )
-    conn.commit()
-    cur.close()
-    conn.close()
+    ) as conn:
+        conn.execute(
+            f"INSERT INTO {DB_CONFIG['default_table']}(type, message, details) VALUES ('test', 'test message', 'test details')"
+        )
     test_database_connection(app, qtbot)
     app.query_btn.setEnabled(True)
     qtbot.mouseClick(app.query_btn, Qt.LeftButton)
@@ -4,18 +4,29 @@ Unit tests for BuildManager.
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import patch
 
 import pytest
 
+from models import build_manager as build_manager_module
 from models.build_manager import BuildManager
 from services.azure_service import AzureServiceError
 
+FILTER_BUILDS = tuple(
+    MappingProxyType(build)
+    for build in (
+        {"id": "build1", "version": "1.0", "status": "available"},
+        {"id": "build2", "version": "2.0", "status": "downloaded"},
+        {"id": "build3", "version": "1.0", "status": "uploaded"},
+    )
+)
+
 
 @pytest.fixture
 def mock_azure_service():
     """Create a mock AzureService."""
-    with patch("quantumops.models.build_manager.AzureService") as mock:
+    with patch.object(build_manager_module, "AzureService") as mock:
         yield mock.return_value
 
 
@@ -231,13 +242,7 @@ def test_filter_builds_success(build_manager):
     """Test successful build filtering."""
     # Arrange
     platform = "android"
-    builds = [
-        {"id": "build1", "version": "1.0", "status": "available"},
-        {"id": "build2", "version": "2.0", "status": "downloaded"},
-        {"id": "build3", "version": "1.0", "status": "uploaded"},
-    ]
-
-    build_manager._builds[platform] = builds
+    build_manager._builds[platform] = list(FILTER_BUILDS)
 
     # Test version filter
     version_filter = {"version": "1.0"}
@@ -1,241 +1,186 @@
 """
 Unit tests for Azure service.
 """
-import os
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 from azure.core.exceptions import ResourceNotFoundError, ServiceRequestError
 
+from services import azure_service as azure_service_module
 from services.azure_service import AzureService, AzureServiceError
 
 
 @pytest.fixture
-def azure_service():
-    """Create an AzureService instance for testing."""
-    service = AzureService()
-    return service
+def mock_blob_service_client():
+    """Create a mock BlobServiceClient."""
+    return Mock()
 
 
 @pytest.fixture
-def mock_blob_service_client():
-    """Create a mock BlobServiceClient."""
-    with patch("azure.storage.blob.BlobServiceClient") as mock:
-        yield mock
+def mock_container_client(mock_blob_service_client):
+    """The container client the mock BlobServiceClient hands out."""
+    return mock_blob_service_client.get_container_client.return_value
 
 
 @pytest.fixture
-def mock_credential():
-    """Create a mock DefaultAzureCredential."""
-    with patch("azure.identity.DefaultAzureCredential") as mock:
-        yield mock
+def azure_service(mock_blob_service_client, mock_container_client):
+    """Create an AzureService wired to mock clients without running __init__."""
+    service = AzureService.__new__(AzureService)
+    service._blob_service_client = mock_blob_service_client
+    service._container_client = mock_container_client
+    service._container_name = "test-container"
+    service._mock_mode = False
+    return service
 
 
-def test_initialize_success(azure_service, mock_credential, mock_blob_service_client):
-    """Test successful initialization."""
+def test_init_success(monkeypatch):
+    """Test that __init__ builds the clients from the environment."""
     # Arrange
-    container_name = "test-container"
-    os.environ["AZURE_STORAGE_ACCOUNT"] = "testaccount"
+    connection_string = "UseDevelopmentStorage=true"
+    monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", connection_string)
+    monkeypatch.setenv("AZURE_STORAGE_CONTAINER", "test-container")
 
     # Act
-    azure_service.initialize(container_name)
+    with patch.object(azure_service_module, "BlobServiceClient") as client_cls:
+        service = AzureService()
 
     # Assert
-    assert azure_service._container_name == container_name
-    assert azure_service._credential is not None
-    assert azure_service._blob_service_client is not None
-
-
-def test_initialize_missing_account(azure_service):
-    """Test initialization with missing storage account."""
-    # Arrange
-    container_name = "test-container"
-    if "AZURE_STORAGE_ACCOUNT" in os.environ:
-        del os.environ["AZURE_STORAGE_ACCOUNT"]
-
-    # Act & Assert
-    with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.initialize(container_name)
-    assert "AZURE_STORAGE_ACCOUNT environment variable not set" in str(exc_info.value)
+    client_cls.from_connection_string.assert_called_once_with(connection_string)
+    blob_service_client = client_cls.from_connection_string.return_value
+    blob_service_client.get_container_client.assert_called_once_with("test-container")
+    assert service._container_client is (
+        blob_service_client.get_container_client.return_value
+    )
 
 
-def test_initialize_credential_error(azure_service, mock_credential):
-    """Test initialization with credential error."""
+@pytest.mark.parametrize(
+    "env,expected_msg",
+    [
+        (
+            {"AZURE_STORAGE_CONTAINER": "test-container"},
+            "Missing required Azure credentials",
+        ),
+        (
+            {"AZURE_STORAGE_CONNECTION_STRING": "UseDevelopmentStorage=true"},
+            "Missing required Azure container name",
+        ),
+    ],
+    ids=["missing_credentials", "missing_container"],
+)
+def test_init_errors(monkeypatch, env, expected_msg):
+    """Test that __init__ rejects an incomplete environment."""
     # Arrange
-    container_name = "test-container"
-    os.environ["AZURE_STORAGE_ACCOUNT"] = "testaccount"
-    mock_credential.side_effect = Exception("Credential error")
+    for name in (
+        "AZURE_STORAGE_CONNECTION_STRING",
+        "AZURE_STORAGE_ACCOUNT_KEY",
+        "AZURE_STORAGE_CONTAINER",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
 
     # Act & Assert
-    with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.initialize(container_name)
-    assert "Failed to initialize Azure service" in str(exc_info.value)
+    with pytest.raises(ValueError) as exc_info:
+        AzureService()
+    assert expected_msg in str(exc_info.value)
 
 
-def test_upload_file_success(azure_service, mock_blob_service_client):
+def test_upload_file_success(azure_service, mock_container_client, tmp_path):
     """Test successful file upload."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
-    file_path = "test.txt"
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(b"test content")
     blob_name = "test-blob"
     metadata = {"key": "value"}
 
-    # Create test file
-    with open(file_path, "w") as f:
-        f.write("test content")
-
-    try:
-        # Act
-        result = azure_service.upload_file(
-            file_path=file_path, blob_name=blob_name, metadata=metadata
-        )
-
-        # Assert
-        assert result is not None
-        mock_blob_service_client.get_blob_client.assert_called_once()
+    # Act
+    result = azure_service.upload_file(
+        file_path=file_path, blob_name=blob_name, metadata=metadata
+    )
 
-    finally:
-        # Cleanup
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    # Assert
+    blob_client = mock_container_client.get_blob_client.return_value
+    assert result == blob_client.url
+    mock_container_client.get_blob_client.assert_called_once_with(blob=blob_name)
+    blob_client.upload_blob.assert_called_once()
+    data = blob_client.upload_blob.call_args.args[0]
+    assert data.name == str(file_path)
+    assert blob_client.upload_blob.call_args.kwargs["metadata"] == metadata
 
 
-def test_upload_file_not_found(azure_service):
+def test_upload_file_not_found(azure_service, tmp_path):
     """Test upload with non-existent file."""
     # Arrange
-    file_path = "nonexistent.txt"
+    file_path = tmp_path / "nonexistent.txt"
 
     # Act & Assert
     with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.upload_file(file_path)
-    assert "File not found" in str(exc_info.value)
+        azure_service.upload_file(file_path, "test-blob")
+    assert "Failed to upload file to Azure" in str(exc_info.value)
 
 
-def test_upload_file_azure_error(azure_service, mock_blob_service_client):
+def test_upload_file_azure_error(azure_service, mock_container_client, tmp_path):
     """Test upload with Azure error."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
-    file_path = "test.txt"
-    with open(file_path, "w") as f:
-        f.write("test content")
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(b"test content")
 
-    mock_blob_service_client.get_blob_client.return_value.upload_blob.side_effect = (
+    mock_container_client.get_blob_client.return_value.upload_blob.side_effect = (
         ServiceRequestError("Network error")
     )
 
-    try:
-        # Act & Assert
-        with pytest.raises(AzureServiceError) as exc_info:
-            azure_service.upload_file(file_path)
-        assert "Network error" in str(exc_info.value)
-
-    finally:
-        if os.path.exists(file_path):
-            os.remove(file_path)
+    # Act & Assert
+    with pytest.raises(AzureServiceError) as exc_info:
+        azure_service.upload_file(file_path, "test-blob")
+    assert "Network error" in str(exc_info.value)
 
 
-def test_download_file_success(azure_service, mock_blob_service_client):
+def test_download_file_success(
+    azure_service, mock_container_client, monkeypatch, tmp_path
+):
     """Test successful file download."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
+    monkeypatch.chdir(tmp_path)
     blob_name = "test-blob"
-    destination_path = "downloaded.txt"
-
-    # Mock blob properties and download stream
-    mock_blob = Mock()
-    mock_blob.size = 100
-    mock_blob.download_blob.return_value.chunks.return_value = [b"test content"]
-
-    mock_blob_service_client.get_blob_client.return_value.get_blob_properties.return_value = (
-        mock_blob
-    )
-
-    try:
-        # Act
-        result = azure_service.download_file(
-            blob_name=blob_name, destination_path=destination_path
-        )
-
-        # Assert
-        assert result == destination_path
-        assert os.path.exists(destination_path)
-
-    finally:
-        # Cleanup
-        if os.path.exists(destination_path):
-            os.remove(destination_path)
-
-
-def test_download_file_not_found(azure_service, mock_blob_service_client):
-    """Test download with non-existent blob."""
-    # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
+    download_path = "downloaded.txt"
 
-    blob_name = "nonexistent-blob"
-    destination_path = "downloaded.txt"
+    blob_client = mock_container_client.get_blob_client.return_value
+    blob_client.download_blob.return_value.readall.return_value = b"test content"
 
-    mock_blob_service_client.get_blob_client.return_value.get_blob_properties.side_effect = ResourceNotFoundError(
-        "Blob not found"
-    )
+    # Act
+    azure_service.download_file(blob_name=blob_name, download_path=download_path)
 
-    # Act & Assert
-    with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.download_file(blob_name, destination_path)
-    assert "Blob not found" in str(exc_info.value)
+    # Assert
+    mock_container_client.get_blob_client.assert_called_once_with(blob=blob_name)
+    with open(download_path, "rb") as downloaded:
+        assert downloaded.read() == b"test content"
 
 
 def test_list_files_success(azure_service, mock_blob_service_client):
     """Test successful file listing."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
     prefix = "test/"
     expected_files = ["test/file1.txt", "test/file2.txt"]
 
-    mock_container = Mock()
-    mock_container.list_blobs.return_value = [
-        Mock(name=name) for name in expected_files
-    ]
-    mock_blob_service_client.get_container_client.return_value = mock_container
+    blobs = [Mock() for _ in expected_files]
+    for blob, name in zip(blobs, expected_files):
+        blob.name = name
+    container_client = mock_blob_service_client.get_container_client.return_value
+    container_client.list_blobs.return_value = blobs
 
     # Act
     result = azure_service.list_files(prefix=prefix)
 
     # Assert
     assert result == expected_files
-
-
-def test_list_files_container_not_found(azure_service, mock_blob_service_client):
-    """Test listing files with non-existent container."""
-    # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "nonexistent-container"
-
-    mock_blob_service_client.get_container_client.return_value.list_blobs.side_effect = ResourceNotFoundError(
-        "Container not found"
-    )
-
-    # Act & Assert
-    with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.list_files()
-    assert "Container not found" in str(exc_info.value)
+    mock_blob_service_client.get_container_client.assert_called_with("test-container")
+    container_client.list_blobs.assert_called_once_with(name_starts_with=prefix)
 
 
 def test_get_file_metadata_success(azure_service, mock_blob_service_client):
     """Test successful metadata retrieval."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
     blob_name = "test-blob"
     last_modified = datetime.now()
     metadata = {"version": "1.0"}
@@ -259,30 +204,9 @@ def test_get_file_metadata_success(azure_service, mock_blob_service_client):
     assert result["metadata"] == metadata
 
 
-def test_get_file_metadata_not_found(azure_service, mock_blob_service_client):
-    """Test metadata retrieval for non-existent blob."""
-    # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
-    blob_name = "nonexistent-blob"
-
-    mock_blob_service_client.get_blob_client.return_value.get_blob_properties.side_effect = ResourceNotFoundError(
-        "Blob not found"
-    )
-
-    # Act & Assert
-    with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.get_file_metadata(blob_name)
-    assert "Blob not found" in str(exc_info.value)
-
-
 def test_delete_file_success(azure_service, mock_blob_service_client):
     """Test successful file deletion."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
-
     blob_name = "test-blob"
 
     # Act
@@ -292,19 +216,67 @@ def test_delete_file_success(azure_service, mock_blob_service_client):
     mock_blob_service_client.get_blob_client.return_value.delete_blob.assert_called_once()
 
 
-def test_delete_file_not_found(azure_service, mock_blob_service_client):
-    """Test deletion of non-existent file."""
+def test_list_files_falls_back_to_mock_mode(azure_service, mock_blob_service_client):
+    """Test that a failed listing switches the service to mock mode."""
     # Arrange
-    azure_service._blob_service_client = mock_blob_service_client
-    azure_service._container_name = "test-container"
+    container_client = mock_blob_service_client.get_container_client.return_value
+    container_client.list_blobs.side_effect = ResourceNotFoundError(
+        "Container not found"
+    )
 
-    blob_name = "nonexistent-blob"
+    # Act
+    result = azure_service.list_files(prefix="android")
 
-    mock_blob_service_client.get_blob_client.return_value.delete_blob.side_effect = (
-        ResourceNotFoundError("Blob not found")
+    # Assert
+    assert azure_service._mock_mode
+    assert result
+    assert all(name.startswith("android/") for name in result)
+
+
+@pytest.mark.parametrize(
+    "client_fixture,blob_method,call,expected_msg",
+    [
+        (
+            "mock_container_client",
+            "download_blob",
+            lambda svc: svc.download_file("nonexistent-blob", "downloaded.txt"),
+            "Failed to download file from Azure",
+        ),
+        (
+            "mock_blob_service_client",
+            "get_blob_properties",
+            lambda svc: svc.get_file_metadata("nonexistent-blob"),
+            "Blob not found",
+        ),
+        (
+            "mock_blob_service_client",
+            "delete_blob",
+            lambda svc: svc.delete_file("nonexistent-blob"),
+            "Blob not found",
+        ),
+    ],
+    ids=["download", "metadata", "delete"],
+)
+def test_blob_not_found(
+    azure_service,
+    request,
+    monkeypatch,
+    tmp_path,
+    client_fixture,
+    blob_method,
+    call,
+    expected_msg,
+):
+    """Test operations on a non-existent blob."""
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    client = request.getfixturevalue(client_fixture)
+    blob_client = client.get_blob_client.return_value
+    getattr(blob_client, blob_method).side_effect = ResourceNotFoundError(
+        "Blob not found"
     )
 
     # Act & Assert
     with pytest.raises(AzureServiceError) as exc_info:
-        azure_service.delete_file(blob_name)
-    assert "Blob not found" in str(exc_info.value)
+        call(azure_service)
+    assert expected_msg in str(exc_info.value)
@@ -3,19 +3,21 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from psycopg2 import Error
-from PySide6.QtWidgets import QDialog, QInputDialog, QMessageBox
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog,
+    QInputDialog,
+    QMessageBox,
+    QProgressBar,
+    QTableWidget,
+)
 
 from main_window import DatabaseApp
 
 
 @pytest.fixture
-def app(qtbot, mocker):
+def app(qtbot, mock_settings):
     """Create the application window with a clean state."""
-    # Mock QSettings to prevent loading saved connections
-    mock_settings = mocker.MagicMock()
-    mock_settings.value.return_value = None  # Return None instead of empty list
-    mocker.patch("PySide6.QtCore.QSettings", return_value=mock_settings)
-
     window = DatabaseApp()
     qtbot.addWidget(window)
 
@@ -40,11 +42,33 @@ def mock_settings(mocker):
     mock_settings = mocker.MagicMock()
     mock_settings.value.return_value = None
     mocker.patch(
-        "app.QSettings", return_value=mock_settings
+        "main_window.QSettings", return_value=mock_settings
     )  # Patch at the module level
     return mock_settings
 
 
+def connection_fields(app):
+    """Return the connection form contents keyed by field name."""
+    return {
+        "host": app.host_label.text(),
+        "port": app.port_label.text(),
+        "dbname": app.dbname_label.text(),
+        "user": app.user_label.text(),
+        "password": app.password_label.text(),
+        "table": app.table_input.text(),
+    }
+
+
+EMPTY_CONNECTION_FIELDS = {
+    "host": "",
+    "port": "5432",
+    "dbname": "",
+    "user": "",
+    "password": "********",  # Password field shows asterisks
+    "table": "error_logs",
+}
+
+
 @pytest.fixture
 def eas_json_output():
     # Use a sample from json-output-example.json
@@ -60,12 +84,7 @@ def test_app_initialization(app):
 
     assert app.windowTitle() == "RVEB - RosieVision Error Browser"
     assert app.connection_combo.count() == 1  # Only empty item
-    assert app.host_label.text() == ""
-    assert app.port_label.text() == "5432"
-    assert app.dbname_label.text() == ""
-    assert app.user_label.text() == ""
-    assert app.password_label.text() == "********"  # Password field shows asterisks
-    assert app.table_input.text() == "error_logs"
+    assert connection_fields(app) == EMPTY_CONNECTION_FIELDS
 
     # Check button states
     assert not app.connect_btn.isEnabled()
@@ -79,12 +98,7 @@ def test_connection_management(app, qtbot):
     """Test connection management functionality."""
     # Test empty connection selection
     app.connection_combo.setCurrentIndex(0)
-    assert app.host_label.text() == ""
-    assert app.port_label.text() == "5432"
-    assert app.dbname_label.text() == ""
-    assert app.user_label.text() == ""
-    assert app.password_label.text() == "********"
-    assert app.table_input.text() == "error_logs"
+    assert connection_fields(app) == EMPTY_CONNECTION_FIELDS
     assert not app.connect_btn.isEnabled()
 
     # Test adding a connection
@@ -102,12 +116,9 @@ def test_connection_management(app, qtbot):
 
     # Test selecting the connection
     app.connection_combo.setCurrentIndex(1)
-    assert app.host_label.text() == test_conn["host"]
-    assert app.port_label.text() == test_conn["port"]
-    assert app.dbname_label.text() == test_conn["dbname"]
-    assert app.user_label.text() == test_conn["user"]
-    assert app.password_label.text() == "********"
-    assert app.table_input.text() == test_conn["table"]
+    expected = {key: test_conn[key] for key in EMPTY_CONNECTION_FIELDS}
+    expected["password"] = "********"
+    assert connection_fields(app) == expected
     assert app.connect_btn.isEnabled()
 
 
@@ -444,6 +455,21 @@ def test_handle_push_to_azure_error(mock_requests_get, mock_upload, app):
     )
 
 
+def test_push_button_click_shows_progress_bar(app, qtbot, mocker):
+    """Test that clicking Push to Azure swaps the button for a progress bar."""
+    handle_push = mocker.patch.object(app, "handle_push_to_azure")
+    build = {"id": "abc", "artifacts": {"buildUrl": "http://example.com/app.apk"}}
+    app._fetched_builds["android"] = [build]
+    app.android_builds_table = QTableWidget(1, 10)
+    app.android_builds_table.setCellWidget(0, 9, app._make_push_button("android", 0))
+
+    qtbot.mouseClick(app.android_builds_table.cellWidget(0, 9), Qt.LeftButton)
+
+    progress_bar = app.android_builds_table.cellWidget(0, 9)
+    assert isinstance(progress_bar, QProgressBar)
+    handle_push.assert_called_once_with(build, "android", progress_bar, 0)
+
+
 def test_real_time_log_viewer(app, tmp_path):
     log_file = tmp_path / "quantumops.log"
     log_file.write_text("Test log entry\n")
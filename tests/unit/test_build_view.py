@@ -0,0 +1,133 @@
+import pytest
+from PySide6.QtCore import Qt
+
+from views.build_view import (
+    ACTIONS_COLUMN,
+    STATUS_COLUMN,
+    BuildTableModel,
+    BuildView,
+    DownloadProgressRole,
+)
+
+BUILDS = [
+    {
+        "id": f"build-{i}",
+        "appVersion": "1.0.0",
+        "appBuildVersion": str(i),
+        "channel": "production",
+        "status": "FINISHED",
+        "createdAt": "2024-01-02T03:04:05Z",
+    }
+    for i in range(250)
+]
+
+
+@pytest.fixture
+def view(qapp):
+    """Create a build view showing BUILDS."""
+    view = BuildView("android")
+    view.update_builds(BUILDS)
+    yield view
+    view.deleteLater()
+
+
+def test_model_fetches_rows_in_batches(qapp):
+    """Test that items are only created for the first batch of builds."""
+    model = BuildTableModel(BUILDS)
+    assert model.rowCount() == BuildTableModel.FETCH_BATCH_SIZE
+    assert model.canFetchMore()
+
+    model.fetchMore()
+    assert model.rowCount() == 2 * BuildTableModel.FETCH_BATCH_SIZE
+    assert model.index(1, 0).data() == "build-1"
+    assert model.index(1, 5).data() == "2024-01-02 03:04:05"
+
+
+def test_loading_overlay_keeps_model(view):
+    """Test that showing and hiding the loading indicator leaves the rows alone."""
+    view.show_loading()
+    assert not view._loading_overlay.isHidden()
+    assert not view.table.isEnabled()
+    assert view._model.rowCount() == BuildTableModel.FETCH_BATCH_SIZE
+
+    view.update_builds(BUILDS[:3])
+    assert view._loading_overlay.isHidden()
+    assert view.table.isEnabled()
+    assert view._model.rowCount() == 3
+
+
+def test_update_build_status(view):
+    """Test status updates on fetched and not yet fetched rows."""
+    view.update_build_status("build-1", "ERRORED")
+    view.update_upload_retry("build-1", 2)
+    assert view._model.index(1, STATUS_COLUMN).data() == "ERRORED - Retry 2"
+
+    view.update_build_status("build-249", "CANCELED")
+    while view._model.canFetchMore():
+        view._model.fetchMore()
+    assert view._model.index(249, STATUS_COLUMN).data() == "CANCELED"
+
+
+def test_download_progress(view):
+    """Test that download progress is only tracked while shown."""
+    view.update_download_progress("build-0", 50)
+    assert view._model.downloadProgress(0) is None
+
+    view.show_download_progress("build-0")
+    view.update_download_progress("build-0", 50)
+    assert view._model.downloadProgress(0) == 50
+
+    view.hide_download_progress("build-0")
+    assert view._model.downloadProgress(0) is None
+
+
+def test_download_progress_on_unfetched_row(view):
+    """Test that progress set before a row is fetched is shown once it is."""
+    view.show_download_progress("build-249")
+    view.update_download_progress("build-249", 30)
+    assert view._model.downloadProgress(249) == 30
+
+    while view._model.canFetchMore():
+        view._model.fetchMore()
+    assert view._model.index(249, ACTIONS_COLUMN).data(DownloadProgressRole) == 30
+
+
+def test_action_clicks_emit_build_id(view, qtbot):
+    """Test that the painted action buttons request the row's build."""
+    view.resize(1000, 400)
+    view.show()
+    rect = view.table.visualRect(view._model.index(2, ACTIONS_COLUMN))
+    download, push = view._actions_delegate._rects(rect)
+    download.setWidth(view._actions_delegate.BUTTON_WIDTH)
+
+    with qtbot.waitSignal(view.download_requested) as blocker:
+        qtbot.mouseClick(view.table.viewport(), Qt.LeftButton, pos=download.center())
+    assert blocker.args == ["build-2"]
+
+    with qtbot.waitSignal(view.push_to_azure_requested) as blocker:
+        qtbot.mouseClick(view.table.viewport(), Qt.LeftButton, pos=push.center())
+    assert blocker.args == ["build-2"]
+
+
+def test_find_row(qapp):
+    """Test that builds are found by id whether or not they are fetched."""
+    model = BuildTableModel(BUILDS)
+    assert model.findRow("build-3") == 3
+    assert model.findRow("build-249") == 249
+    assert model.findRow("missing") is None
+
+
+@pytest.mark.parametrize(
+    "size_bytes, expected",
+    [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536 * 1024, "1.5 MB"),
+        (2**50 * 3, "3.0 PB"),
+        (2**60, "1024.0 PB"),
+    ],
+)
+def test_format_size(view, size_bytes, expected):
+    """Test that sizes are shown in the largest unit below 1024."""
+    assert view._format_size(size_bytes) == expected
@@ -1,20 +1,27 @@
 import pytest
 from PySide6.QtCore import QSize
-from PySide6.QtGui import QPainter
+from PySide6.QtGui import QFontMetrics, QPainter
 from PySide6.QtWidgets import QStyleOptionViewItem, QTableWidget, QTableWidgetItem
 
 # from delegates import DetailsDelegate  # MISSING MODULE, COMMENTED OUT
 
 
-@pytest.fixture
-def table():
-    """Create a table widget with test data."""
+@pytest.fixture(scope="module")
+def table(qapp):
+    """Create a table widget shared by the tests in this module."""
     table = QTableWidget(1, 1)
-    table.setItem(0, 0, QTableWidgetItem("Test message"))
-    return table
+    table.setItem(0, 0, QTableWidgetItem())
+    yield table
+    table.deleteLater()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_table(table):
+    """Restore the shared table's test data before each test."""
+    table.item(0, 0).setText("Test message")
+
+
+@pytest.fixture(scope="module")
 def delegate():
     """Create a details delegate."""
     return DetailsDelegate()
@@ -67,33 +74,38 @@ def test_format_details():
 
 
 @pytest.mark.skip(reason="Skipped: depends on missing delegates/DetailsDelegate")
-def test_delegate_style(delegate):
+@pytest.mark.parametrize(
+    "style_property",
+    [
+        "font-family",
+        "font-size",
+        "color",
+        "background-color",
+        "padding",
+        "border",
+        "border-radius",
+    ],
+)
+def test_delegate_style(delegate, style_property):
     """Test that the delegate applies correct styling."""
-    # Test HTML formatting
-    details = "Test message"
-    formatted = DetailsDelegate.format_details(details)
-    assert "font-family" in formatted
-    assert "font-size" in formatted
-    assert "color" in formatted
-    assert "background-color" in formatted
-    assert "padding" in formatted
-    assert "border" in formatted
-    assert "border-radius" in formatted
+    formatted = DetailsDelegate.format_details("Test message")
+    assert style_property in formatted
 
 
 @pytest.mark.skip(reason="Skipped: depends on missing delegates/DetailsDelegate")
-def test_delegate_performance(delegate, table):
-    """Test delegate performance with large data."""
-    # Create large test data
-    large_data = "Test message " * 1000
-    table.setItem(0, 0, QTableWidgetItem(large_data))
+def test_delegate_performance(delegate, table, monkeypatch):
+    """Test that sizing large data measures the text a bounded number of times."""
+    # Count text measurements instead of timing them
+    measurements = []
+    bounding_rect = QFontMetrics.boundingRect
+
+    def counting_bounding_rect(self, *args):
+        measurements.append(args)
+        return bounding_rect(self, *args)
 
-    # Measure size hint calculation time
-    import time
+    monkeypatch.setattr(QFontMetrics, "boundingRect", counting_bounding_rect)
+    table.item(0, 0).setText("Test message " * 32)
 
-    start_time = time.time()
     delegate.sizeHint(QStyleOptionViewItem(), table.model().index(0, 0))
-    end_time = time.time()
 
-    # Verify performance
-    assert end_time - start_time < 0.1  # Should take less than 100ms
+    assert len(measurements) <= 2
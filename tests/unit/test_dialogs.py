@@ -1,6 +1,7 @@
-# from dialogs import ConnectionDialog  # MISSING MODULE, COMMENTED OUT
 import pytest
 
+ConnectionDialog = pytest.importorskip("dialogs").ConnectionDialog
+
 
 @pytest.fixture
 def dialog(qtbot):
@@ -10,7 +11,6 @@ def dialog(qtbot):
     return dialog
 
 
-@pytest.mark.skip(reason="Skipped: depends on missing dialogs/ConnectionDialog")
 def test_dialog_initialization(dialog):
     """Test that the dialog initializes correctly."""
     assert dialog.windowTitle() == "Add Connection"
@@ -23,7 +23,6 @@ def test_dialog_initialization(dialog):
     assert dialog.table_input.text() == ""
 
 
-@pytest.mark.skip(reason="Skipped: depends on missing dialogs/ConnectionDialog")
 def test_connection_data(dialog):
     """Test getting connection data."""
     # Set test data
@@ -48,7 +47,6 @@ def test_connection_data(dialog):
     assert data["default_table"] == "test_table"
 
 
-@pytest.mark.skip(reason="Skipped: depends on missing dialogs/ConnectionDialog")
 def test_edit_existing_connection(qtbot):
     """Test editing an existing connection."""
     # Create test connection data
@@ -77,7 +75,6 @@ def test_edit_existing_connection(qtbot):
     assert dialog.table_input.text() == "test_table"
 
 
-@pytest.mark.skip(reason="Skipped: depends on missing dialogs/ConnectionDialog")
 def test_dialog_validation(dialog):
     """Test dialog validation."""
     # Try to accept with empty fields
@@ -95,7 +92,6 @@ def test_dialog_validation(dialog):
     assert dialog.result() == 1  # Dialog should be accepted
 
 
-@pytest.mark.skip(reason="Skipped: depends on missing dialogs/ConnectionDialog")
 def test_dialog_cancel(dialog):
     """Test dialog cancellation."""
     # Fill in some fields
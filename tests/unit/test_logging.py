@@ -3,35 +3,35 @@ import pytest
 from main_window import DatabaseApp
 
 
-@pytest.fixture
-def app(qtbot):
-    """Create the application window."""
+@pytest.fixture(scope="module")
+def app(qapp):
+    """Create the application window shared by the tests in this module."""
     window = DatabaseApp()
-    qtbot.addWidget(window)
-    return window
-
-
-def test_log_message_types(app):
+    yield window
+    window.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_log(app):
+    """Clear the shared log before each test."""
+    app.log_output.clear()
+
+
+@pytest.mark.parametrize(
+    "level,message",
+    [
+        ("INFO", "Test info message"),
+        ("ERROR", "Test error message"),
+        ("WARNING", "Test warning message"),
+        ("SUCCESS", "Test success message"),
+    ],
+)
+def test_log_message_types(app, level, message):
     """Test different types of log messages."""
-    # Test info message
-    app.log_message("Test info message", "INFO")
-    assert "INFO" in app.log_output.toPlainText()
-    assert "Test info message" in app.log_output.toPlainText()
-
-    # Test error message
-    app.log_message("Test error message", "ERROR")
-    assert "ERROR" in app.log_output.toPlainText()
-    assert "Test error message" in app.log_output.toPlainText()
-
-    # Test warning message
-    app.log_message("Test warning message", "WARNING")
-    assert "WARNING" in app.log_output.toPlainText()
-    assert "Test warning message" in app.log_output.toPlainText()
-
-    # Test success message
-    app.log_message("Test success message", "SUCCESS")
-    assert "SUCCESS" in app.log_output.toPlainText()
-    assert "Test success message" in app.log_output.toPlainText()
+    app.log_message(message, level)
+    log_text = app.log_output.toPlainText()
+    assert level in log_text
+    assert message in log_text
 
 
 def test_log_clear(app):
@@ -73,9 +73,10 @@ def test_log_scroll(app):
 
 def test_log_maximum_size(app):
     """Test that the log doesn't grow indefinitely."""
-    # Add many messages
-    for i in range(1000):
-        app.log_message(f"Message {i}", "INFO")
+    # Fill the log in one call, then go through log_message once more
+    messages = "\n".join(f"[INFO] Message {i}" for i in range(1000))
+    app.log_output.setPlainText(messages)
+    app.log_message("Message 1000", "INFO")
 
     # Check that the log size is reasonable
     log_size = len(app.log_output.toPlainText())
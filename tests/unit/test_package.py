@@ -1,83 +1,52 @@
-from pathlib import Path
+import importlib.util
+import re
 
+README_SECTIONS = ("# PostgreSQL Viewer", "## Installation", "## Usage", "## License")
+README_SECTION_PATTERN = re.compile("|".join(map(re.escape, README_SECTIONS)))
 
-def test_package_structure():
+
+def test_package_structure(repo_files):
     """Test that the package has the correct structure."""
     # Check main package files
-    assert Path("main.py").exists(), "main.py not found"
-    assert Path("app.py").exists(), "app.py not found"
-    assert Path("theme.py").exists(), "theme.py not found"
-    assert Path("delegates.py").exists(), "delegates.py not found"
-    assert Path("dialogs.py").exists(), "dialogs.py not found"
+    assert "main.py" in repo_files, "main.py not found"
+    assert "app.py" in repo_files, "app.py not found"
+    assert "theme.py" in repo_files, "theme.py not found"
+    assert "delegates.py" in repo_files, "delegates.py not found"
+    assert "dialogs.py" in repo_files, "dialogs.py not found"
 
     # Check test files
-    assert Path("tests").exists(), "tests directory not found"
-    assert Path("tests/unit").exists(), "tests/unit directory not found"
-    assert Path("tests/integration").exists(), "tests/integration directory not found"
+    assert "tests" in repo_files, "tests directory not found"
+    assert "tests/unit" in repo_files, "tests/unit directory not found"
+    assert "tests/integration" in repo_files, "tests/integration directory not found"
 
     # Check configuration files
-    assert Path("requirements.txt").exists(), "requirements.txt not found"
-    assert Path("setup.py").exists(), "setup.py not found"
-    assert Path("README.md").exists(), "README.md not found"
-    assert Path("LICENSE").exists(), "LICENSE not found"
-    assert Path(".gitignore").exists(), ".gitignore not found"
+    assert "requirements.txt" in repo_files, "requirements.txt not found"
+    assert "setup.py" in repo_files, "setup.py not found"
+    assert "README.md" in repo_files, "README.md not found"
+    assert "LICENSE" in repo_files, "LICENSE not found"
+    assert ".gitignore" in repo_files, ".gitignore not found"
 
 
 def test_imports():
     """Test that all modules can be imported."""
-    import app
-    import delegates
-    import dialogs
-    import theme
-
-    import main
-
-    assert main is not None
-    assert app is not None
-    assert theme is not None
-    assert delegates is not None
-    assert dialogs is not None
+    for module in ("main", "app", "theme", "delegates", "dialogs"):
+        assert importlib.util.find_spec(module) is not None, f"{module} not found"
 
 
 def test_dependencies():
     """Test that all required dependencies are installed."""
-
-    # Check PySide6
-    try:
-        pass
-
-        assert True
-    except ImportError:
-        assert False, "PySide6 not installed"
-
-    # Check psycopg2
-    try:
-        pass
-
-        assert True
-    except ImportError:
-        assert False, "psycopg2 not installed"
-
-    # Check pytest
-    try:
-        pass
-
-        assert True
-    except ImportError:
-        assert False, "pytest not installed"
+    for package in ("PySide6", "psycopg2", "pytest"):
+        assert importlib.util.find_spec(package) is not None, f"{package} not installed"
 
 
-def test_documentation():
+def test_documentation(project_files):
     """Test that documentation exists and is valid."""
     # Check README
-    readme = Path("README.md")
-    assert readme.exists(), "README.md not found"
-    with open(readme) as f:
-        content = f.read()
-        assert "# PostgreSQL Viewer" in content
-        assert "## Installation" in content
-        assert "## Usage" in content
-        assert "## License" in content
+    assert "README.md" in project_files, "README.md not found"
+    content = project_files["README.md"]
+    found = set(README_SECTION_PATTERN.findall(content))
+    missing = [section for section in README_SECTIONS if section not in found]
+    assert not missing, f"README.md is missing {missing}"
 
     # Check docstrings
     import app
@@ -4,12 +4,18 @@ from PySide6.QtCore import Qt
 from main_window import DatabaseApp
 
 
-@pytest.fixture
-def app(qtbot):
-    """Create the application window."""
+@pytest.fixture(scope="module")
+def app(qapp):
+    """Create the application window shared by the tests in this module."""
     window = DatabaseApp()
-    qtbot.addWidget(window)
-    return window
+    yield window
+    window.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_results(app):
+    """Clear the shared results table before each test."""
+    app.clear_results()
 
 
 def test_query_results_formatting(app):
@@ -29,15 +35,13 @@ def test_query_results_formatting(app):
     assert app.results_table.columnCount() == 4
 
     # Check headers
-    for i, header in enumerate(headers):
-        assert app.results_table.horizontalHeaderItem(i).text() == header
+    table = app.results_table
+    actual_headers = [table.horizontalHeaderItem(i).text() for i in range(4)]
+    assert actual_headers == headers
 
     # Check data
-    for row, (id_val, timestamp, level, message) in enumerate(data):
-        assert app.results_table.item(row, 0).text() == str(id_val)
-        assert app.results_table.item(row, 1).text() == timestamp
-        assert app.results_table.item(row, 2).text() == level
-        assert app.results_table.item(row, 3).text() == message
+    actual = [[table.item(r, c).text() for c in range(4)] for r in range(2)]
+    assert actual == [[str(value) for value in row] for row in data]
 
 
 def test_query_results_clear(app):
@@ -1,8 +1,12 @@
 import os
+import threading
 from datetime import datetime
+from unittest.mock import Mock
 
 import pytest
 
+from utils import ensure_main_thread, log_database_operation
+
 
 @pytest.mark.unit
 def test_format_log_message():
@@ -34,3 +38,48 @@ def test_build_db_conn_string():
         build_conn("localhost", 5432, "mydb", "user")
         == "host=localhost port=5432 dbname=mydb user=user"
     )
+
+
+class _Widget:
+    def __init__(self):
+        self.main_thread_signal = Mock()
+
+    @ensure_main_thread
+    def double(self, value):
+        return value * 2
+
+
+@pytest.mark.unit
+def test_ensure_main_thread_runs_directly_on_main_thread():
+    widget = _Widget()
+
+    assert widget.double(21) == 42
+    widget.main_thread_signal.emit.assert_not_called()
+
+
+@pytest.mark.unit
+def test_ensure_main_thread_defers_from_worker_thread():
+    widget = _Widget()
+
+    worker = threading.Thread(target=widget.double, args=(21,))
+    worker.start()
+    worker.join()
+
+    widget.main_thread_signal.emit.assert_called_once()
+    (deferred,) = widget.main_thread_signal.emit.call_args.args
+    assert deferred() == 42
+
+
+@pytest.mark.unit
+def test_log_database_operation_logs_failure(caplog):
+    @log_database_operation("query")
+    def failing_query():
+        raise ValueError("boom")
+
+    with caplog.at_level("INFO", logger="utils"), pytest.raises(ValueError):
+        failing_query()
+
+    assert caplog.messages == [
+        "Starting database operation: query",
+        "Failed database operation query: boom",
+    ]
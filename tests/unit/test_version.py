@@ -1,18 +1,19 @@
-from pathlib import Path
+import pytest
 
 
-def test_version_file_exists():
+@pytest.fixture
+def version(project_files):
+    """Return the version number from the cached config/version.txt contents."""
+    return project_files["config/version.txt"].strip()
+
+
+def test_version_file_exists(repo_files):
     """Test that the version file exists."""
-    version_file = Path("version.txt")
-    assert version_file.exists(), "version.txt not found"
+    assert "config/version.txt" in repo_files, "config/version.txt not found"
 
 
-def test_version_format():
+def test_version_format(version):
     """Test that the version number has the correct format."""
-    version_file = Path("version.txt")
-    with open(version_file) as f:
-        version = f.read().strip()
-
     # Check version format (e.g., "1.0.0")
     parts = version.split(".")
     assert len(parts) == 3, "Version must have 3 parts (major.minor.patch)"
@@ -25,45 +26,28 @@ def test_version_format():
     assert 0 <= patch <= 999, "Patch version out of range"
 
 
-def test_version_increment():
+def test_version_increment(version, tmp_path):
     """Test that the version can be incremented."""
-    version_file = Path("version.txt")
-    with open(version_file) as f:
-        original_version = f.read().strip()
+    # Write to a file under tmp_path so the real version.txt is never touched
+    version_file = tmp_path / "version.txt"
 
     # Increment patch version
-    parts = original_version.split(".")
+    parts = version.split(".")
     new_version = f"{parts[0]}.{parts[1]}.{int(parts[2]) + 1}"
 
     # Write new version
-    with open(version_file, "w") as f:
-        f.write(new_version)
+    version_file.write_text(new_version, encoding="utf-8")
 
     # Verify new version
-    with open(version_file) as f:
-        assert f.read().strip() == new_version
-
-    # Restore original version
-    with open(version_file, "w") as f:
-        f.write(original_version)
+    assert version_file.read_text(encoding="utf-8").strip() == new_version
 
 
-def test_version_consistency():
+def test_version_consistency(version, project_files):
     """Test that the version is consistent across files."""
-    version_file = Path("version.txt")
-    with open(version_file) as f:
-        version = f.read().strip()
-
     # Check version in setup.py
-    setup_file = Path("setup.py")
-    if setup_file.exists():
-        with open(setup_file) as f:
-            setup_content = f.read()
-            assert f'version="{version}"' in setup_content
+    if "setup.py" in project_files:
+        assert f'version="{version}"' in project_files["setup.py"]
 
     # Check version in README.md
-    readme_file = Path("README.md")
-    if readme_file.exists():
-        with open(readme_file) as f:
-            readme_content = f.read()
-            assert version in readme_content
+    if "README.md" in project_files:
+        assert version in project_files["README.md"]
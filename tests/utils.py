@@ -1,58 +1,134 @@
 """Test utilities."""
+import atexit
 import time
-from typing import Any, Dict
-
-import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from typing import TYPE_CHECKING, Any, Dict
 
 from .db_config import DB_CONFIG, TEST_TABLE_SCHEMA
 
+if TYPE_CHECKING:
+    from psycopg_pool import ConnectionPool
+
+# psycopg is imported inside the helpers so that collecting tests which never
+# touch the database does not pay for loading the driver
+_POOLS: Dict[str, "ConnectionPool"] = {}
+
+
+# Server arguments shared by every connection, resolved from DB_CONFIG once
+_SERVER_KWARGS: Dict[str, Any] = {
+    "user": DB_CONFIG["username"],
+    "password": DB_CONFIG["password"],
+    "host": DB_CONFIG["host"],
+    "port": DB_CONFIG["port"],
+    "connect_timeout": 1,
+}
+
+
+def _connect_kwargs(dbname: str, autocommit: bool = False) -> Dict[str, Any]:
+    """Return psycopg connection arguments for a database on the test server."""
+    return {**_SERVER_KWARGS, "dbname": dbname, "autocommit": autocommit}
+
+
+def _get_pool(dbname: str) -> "ConnectionPool":
+    """Return the connection pool for a database, opening it on first use.
+
+    Connections to the postgres maintenance database run in autocommit mode,
+    which CREATE DATABASE and DROP DATABASE require.
+    """
+    pool = _POOLS.get(dbname)
+    if pool is None:
+        from psycopg_pool import ConnectionPool
+
+        pool = ConnectionPool(
+            kwargs=_connect_kwargs(dbname, autocommit=dbname == "postgres"),
+            min_size=2,
+            max_size=10,
+            open=True,
+        )
+        # Have the pool workers open min_size connections in parallel and ping
+        # them, so the first tests do not pay for cold connections
+        try:
+            pool.wait(timeout=5.0)
+            pool.check()
+        except Exception:
+            pool.close()
+            raise
+        _POOLS[dbname] = pool
+    return pool
+
+
+def _close_pool(dbname: str) -> None:
+    """Close every pooled connection to a database, e.g. before dropping it."""
+    pool = _POOLS.pop(dbname, None)
+    if pool is not None:
+        pool.close()
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Close any pools still open when the test process exits."""
+    for dbname in list(_POOLS):
+        _close_pool(dbname)
+
+
+def wait_for_postgres(max_retries: int = 15, max_delay: float = 1.0) -> None:
+    """Wait for PostgreSQL to be ready, backing off exponentially from 50 ms."""
+    import psycopg
 
-def wait_for_postgres(max_retries: int = 5, delay: int = 2) -> None:
-    """Wait for PostgreSQL to be ready."""
     for i in range(max_retries):
         try:
-            conn = psycopg2.connect(
-                dbname="postgres",
-                user="postgres",
-                password="postgres",
-                host="localhost",
-            )
-            conn.close()
+            psycopg.connect(**_connect_kwargs("postgres")).close()
             return
-        except psycopg2.OperationalError:
+        except psycopg.OperationalError:
             if i == max_retries - 1:
                 raise
-            time.sleep(delay)
+            time.sleep(min(max_delay, 0.05 * 2**i))
+
+
+TEMPLATE_DATABASE = "test_db_template"
+
+
+def _create_template_database(conn) -> None:
+    """Build the schema once into a template database, if it does not exist yet.
+
+    Drop the template by hand after changing TEST_TABLE_SCHEMA so it is rebuilt.
+    """
+    import psycopg
+
+    query = "SELECT 1 FROM pg_database WHERE datname = %s"
+    if conn.execute(query, (TEMPLATE_DATABASE,)).fetchone():
+        return
+
+    conn.execute(f"CREATE DATABASE {TEMPLATE_DATABASE}")
+    # Apply the whole schema in one transaction; leaving the block commits it
+    with psycopg.connect(**_connect_kwargs(TEMPLATE_DATABASE)) as tpl:
+        tpl.execute(TEST_TABLE_SCHEMA)
+    conn.execute(f"ALTER DATABASE {TEMPLATE_DATABASE} IS_TEMPLATE = true")
 
 
 def create_test_database() -> Dict[str, Any]:
-    """Create a test database and the test_table, then return connection info."""
+    """Clone the test database from the schema template unless it already exists.
+
+    An existing test database is reused as is; tests empty it with
+    truncate_test_tables instead of paying for DROP DATABASE.
+    """
     wait_for_postgres()
 
-    conn = psycopg2.connect(
-        dbname="postgres", user="postgres", password="postgres", host="localhost"
-    )
-    conn.autocommit = True
-    cursor = conn.cursor()
-
-    cursor.execute("DROP DATABASE IF EXISTS test_db")
-    cursor.execute("CREATE DATABASE test_db")
-    cursor.close()
-    conn.close()
-
-    # Now connect to test_db and create the test_table
-    test_db_conn = psycopg2.connect(
-        dbname="test_db", user="postgres", password="postgres", host="localhost"
-    )
-    test_db_conn.autocommit = True
-    test_db_cursor = test_db_conn.cursor()
-    test_db_cursor.execute(TEST_TABLE_SCHEMA)
-    test_db_cursor.close()
-    test_db_conn.close()
+    with _get_pool("postgres").connection() as conn:
+        # Serialize template creation and cloning across concurrent test sessions
+        conn.execute("SELECT pg_advisory_lock(hashtext(%s))", (TEMPLATE_DATABASE,))
+        try:
+            _create_template_database(conn)
+            database = DB_CONFIG["database"]
+            query = "SELECT 1 FROM pg_database WHERE datname = %s"
+            if not conn.execute(query, (database,)).fetchone():
+                conn.execute(f"CREATE DATABASE {database} TEMPLATE {TEMPLATE_DATABASE}")
+        finally:
+            conn.execute(
+                "SELECT pg_advisory_unlock(hashtext(%s))", (TEMPLATE_DATABASE,)
+            )
 
     return {
-        "dbname": "test_db",
+        "dbname": DB_CONFIG["database"],
         "user": "postgres",
         "password": "postgres",
         "host": "localhost",
@@ -61,26 +137,27 @@ def create_test_database() -> Dict[str, Any]:
 
 def drop_test_database():
     """Drop the test database."""
-    conn = psycopg2.connect(
-        dbname="postgres",
-        user=DB_CONFIG["username"],
-        password=DB_CONFIG["password"],
-        host=DB_CONFIG["host"],
-    )
-    conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+    _close_pool(DB_CONFIG["database"])
 
-    cur = conn.cursor()
-    cur.execute(f"DROP DATABASE IF EXISTS {DB_CONFIG['database']}")
-    cur.close()
-    conn.close()
+    with _get_pool("postgres").connection() as conn:
+        conn.execute(f"DROP DATABASE IF EXISTS {DB_CONFIG['database']}")
+
+
+def truncate_test_tables(conn) -> None:
+    """Empty the test tables and restart their id sequences."""
+    conn.execute("TRUNCATE test_table RESTART IDENTITY CASCADE")
+    conn.commit()
 
 
 def get_test_connection():
-    """Get a connection to the test database."""
-    return psycopg2.connect(
-        dbname=DB_CONFIG["database"],
-        user=DB_CONFIG["username"],
-        password=DB_CONFIG["password"],
-        host=DB_CONFIG["host"],
-        port=DB_CONFIG["port"],
-    )
+    """Get a pooled connection to the test database."""
+    return _get_pool(DB_CONFIG["database"]).getconn()
+
+
+def release_test_connection(conn) -> None:
+    """Return a connection from get_test_connection to the pool."""
+    pool = _POOLS.get(DB_CONFIG["database"])
+    if pool is None:
+        conn.close()
+    else:
+        pool.putconn(conn)
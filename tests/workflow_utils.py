@@ -0,0 +1,13 @@
+"""Shared expectations for the GitHub workflow tests."""
+import re
+
+# Sections the build workflow must contain, matched in one pass over the file
+WORKFLOW_SECTIONS = (
+    "name: Build QuantumOps",
+    "on:",
+    "jobs:",
+    "build:",
+    "Build on ${{ matrix.os }}",
+    "pyinstaller quantumops.spec",
+)
+WORKFLOW_SECTION_PATTERN = re.compile("|".join(map(re.escape, WORKFLOW_SECTIONS)))
@@ -1,6 +1,6 @@
 import logging
 import threading
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable
 
 # Configure logging
@@ -9,58 +9,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# The main thread never changes, so compare against its ident captured once
+_MAIN_THREAD_IDENT = threading.main_thread().ident
+
 
 def ensure_main_thread(func: Callable) -> Callable:
     """Decorator to ensure function runs on main thread. Expects self.main_thread_signal to exist."""
 
     @wraps(func)
     def wrapper(self, *args: Any, **kwargs: Any) -> Any:
-        if threading.current_thread() is threading.main_thread():
+        if threading.get_ident() == _MAIN_THREAD_IDENT:
             return func(self, *args, **kwargs)
         else:
-            self.main_thread_signal.emit(lambda: func(self, *args, **kwargs))
+            self.main_thread_signal.emit(partial(func, self, *args, **kwargs))
 
     return wrapper
 
 
-def log_azure_operation(operation: str) -> Callable:
-    """Decorator to log Azure operations"""
+def _log_operation(category: str, operation: str) -> Callable:
+    """Build a decorator that logs the start, end and failure of an operation"""
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.info(f"Starting Azure operation: {operation}")
+            log_progress = logger.isEnabledFor(logging.INFO)
+            if log_progress:
+                logger.info("Starting %s operation: %s", category, operation)
             try:
                 result = func(*args, **kwargs)
-                logger.info(f"Completed Azure operation: {operation}")
-                return result
             except Exception as e:
-                logger.error(f"Failed Azure operation {operation}: {str(e)}")
+                logger.error("Failed %s operation %s: %s", category, operation, e)
                 raise
+            if log_progress:
+                logger.info("Completed %s operation: %s", category, operation)
+            return result
 
         return wrapper
 
     return decorator
 
 
-def log_database_operation(operation: str) -> Callable:
-    """Decorator to log database operations"""
-
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            logger.info(f"Starting database operation: {operation}")
-            try:
-                result = func(*args, **kwargs)
-                logger.info(f"Completed database operation: {operation}")
-                return result
-            except Exception as e:
-                logger.error(f"Failed database operation {operation}: {str(e)}")
-                raise
+def log_azure_operation(operation: str) -> Callable:
+    """Decorator to log Azure operations"""
+    return _log_operation("Azure", operation)
 
-        return wrapper
 
-    return decorator
+def log_database_operation(operation: str) -> Callable:
+    """Decorator to log database operations"""
+    return _log_operation("database", operation)
 
 
 # Test database functions
@@ -3,25 +3,309 @@ Build view for displaying and managing mobile builds.
 """
 import logging
 from datetime import datetime
-
-from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QIcon
+from functools import lru_cache, partial
+
+from PySide6.QtCore import (
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    QThreadPool,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QIcon, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QAbstractItemView,
-    QHBoxLayout,
+    QApplication,
     QHeaderView,
+    QLabel,
     QMessageBox,
-    QProgressBar,
-    QPushButton,
-    QStackedWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyleOptionProgressBar,
+    QTableView,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
 
 logger = logging.getLogger(__name__)
 
+BUILD_COLUMNS = (
+    "Build ID",
+    "Version",
+    "Version Code",
+    "Channel",
+    "Status",
+    "Date",
+    "Actions",
+)
+# Fixed initial widths, so filling the table never measures cell contents; the
+# Actions width leaves room for the download progress bar and push button
+BUILD_COLUMN_WIDTHS = (260, 90, 110, 110, 160, 150, 200)
+STATUS_COLUMN = 4
+ACTIONS_COLUMN = 6
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Model role holding the download progress (0-100) of a row, or None when idle
+DownloadProgressRole = Qt.UserRole + 1
+
+
+@lru_cache(maxsize=4096)
+def _format_created_at(date_str: str) -> str:
+    """Format an ISO 8601 build timestamp for display.
+
+    Builds keep their timestamps across refreshes, so each one is only parsed
+    the first time it is shown.
+    """
+    date_obj = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    return date_obj.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _prepare_created_at(builds: list, start: int):
+    """Format the timestamps of builds from start on, filling the cache.
+
+    Runs on a thread pool thread so later fetches only create items.
+    """
+    for build in builds[start:]:
+        date_str = build.get("createdAt", "")
+        if date_str:
+            _format_created_at(date_str)
+
+
+class BuildTableModel(QStandardItemModel):
+    """Table model over a list of build dicts, filled in as the view scrolls.
+
+    The builds list is kept by reference and items are only created a batch
+    at a time through canFetchMore/fetchMore, when the view scrolls near the
+    last fetched row, so rows that are never shown cost nothing.
+    """
+
+    FETCH_BATCH_SIZE = 100
+
+    def __init__(self, builds: list = None, parent=None):
+        super().__init__(0, len(BUILD_COLUMNS), parent)
+        self.setHorizontalHeaderLabels(BUILD_COLUMNS)
+        self._builds = []
+        self._row_by_id = {}
+        # Status text set on rows that have not been fetched yet
+        self._statuses = {}
+        # Download progress set on unfetched rows, keyed by build id
+        self._download_progress = {}
+        if builds:
+            self.setBuilds(builds)
+
+    def setBuilds(self, builds: list):
+        """Replace the builds shown by the model."""
+        self._builds = builds
+        self._row_by_id = {build.get("id"): row for row, build in enumerate(builds)}
+        self._statuses = {}
+        self._download_progress = {}
+        self.setRowCount(0)
+        # Fill the first screen; the view fetches the rest as it is scrolled
+        if self.canFetchMore():
+            self.fetchMore()
+        if self.canFetchMore():
+            QThreadPool.globalInstance().start(
+                partial(_prepare_created_at, builds, self.rowCount())
+            )
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self.rowCount() < len(self._builds)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = self.rowCount()
+        stop = min(start + self.FETCH_BATCH_SIZE, len(self._builds))
+        if stop <= start:
+            return
+        # Announce the batch with one rowsInserted and one dataChanged, instead
+        # of a rowsInserted per row and an itemChanged per cell
+        self.setRowCount(stop)
+        blocked = self.blockSignals(True)
+        try:
+            for row in range(start, stop):
+                for column, item in enumerate(self._row_items(row)):
+                    self.setItem(row, column, item)
+        finally:
+            self.blockSignals(blocked)
+        self.dataChanged.emit(
+            self.index(start, 0), self.index(stop - 1, self.columnCount() - 1)
+        )
+
+    def _row_items(self, row: int) -> list:
+        """Create the items of a row from its build."""
+        build = self._builds[row]
+        date_str = build.get("createdAt", "")
+        if date_str:
+            date_str = _format_created_at(date_str)
+        values = (
+            build.get("id"),
+            build.get("appVersion", "N/A"),
+            build.get("appBuildVersion", "N/A"),
+            build.get("channel", "N/A"),
+            self._statuses.pop(row, build.get("status", "N/A")),
+            date_str,
+            "",
+        )
+        items = [QStandardItem(value) for value in values]
+        progress = self._download_progress.pop(build.get("id"), None)
+        if progress is not None:
+            items[ACTIONS_COLUMN].setData(progress, DownloadProgressRole)
+        return items
+
+    def _is_fetched(self, row: int) -> bool:
+        return row < self.rowCount()
+
+    def findRow(self, build_id: str):
+        """Return the row of a build, fetched or not, or None."""
+        return self._row_by_id.get(build_id)
+
+    def buildId(self, row: int) -> str:
+        """Return the id of the build shown in a row."""
+        return self._builds[row].get("id")
+
+    def status(self, row: int) -> str:
+        """Return the status text shown in a row."""
+        if self._is_fetched(row):
+            return self.item(row, STATUS_COLUMN).text()
+        return self._statuses.get(row, self._builds[row].get("status", "N/A"))
+
+    def setStatus(self, row: int, status: str):
+        """Change the status text shown in a row."""
+        if self._is_fetched(row):
+            self.item(row, STATUS_COLUMN).setText(status)
+        else:
+            self._statuses[row] = status
+
+    def downloadProgress(self, row: int):
+        """Return a row's download progress, or None when it is not downloading."""
+        if not self._is_fetched(row):
+            return self._download_progress.get(self.buildId(row))
+        return self.item(row, ACTIONS_COLUMN).data(DownloadProgressRole)
+
+    def setDownloadProgress(self, row: int, value):
+        """Set a row's download progress, or None to show the download button."""
+        if self._is_fetched(row):
+            self.item(row, ACTIONS_COLUMN).setData(value, DownloadProgressRole)
+        elif value is None:
+            self._download_progress.pop(self.buildId(row), None)
+        else:
+            self._download_progress[self.buildId(row)] = value
+
+
+class BuildActionsDelegate(QStyledItemDelegate):
+    """Paint the download and push buttons of the Actions column.
+
+    The buttons are drawn with the widget style rather than created as cell
+    widgets, and clicks are hit-tested in editorEvent. While a download is in
+    progress the download button is replaced by a progress bar.
+    """
+
+    download_clicked = Signal(int)  # row
+    push_clicked = Signal(int)  # row
+
+    BUTTON_WIDTH = 40
+    PROGRESS_WIDTH = 120
+    SPACING = 10
+    ICON_SIZE = QSize(16, 16)
+
+    # Button icons shared by every build view, keyed by resource path
+    _icon_cache = {}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._download_icon = self._icon(":/icons/download.svg")
+        self._push_icon = self._icon(":/icons/upload.svg")
+
+    def _icon(self, path: str) -> QIcon:
+        """Return a shared icon, rendering its SVG once at the button icon size."""
+        icon = self._icon_cache.get(path)
+        if icon is None:
+            icon = QIcon(QIcon(path).pixmap(self.ICON_SIZE))
+            self._icon_cache[path] = icon
+        return icon
+
+    def _rects(self, rect: QRect):
+        """Return the download area and push button rects within a cell."""
+        width = self.PROGRESS_WIDTH + self.SPACING + self.BUTTON_WIDTH
+        left = rect.left() + max(0, (rect.width() - width) // 2)
+        top, height = rect.top() + 2, rect.height() - 4
+        download = QRect(left, top, self.PROGRESS_WIDTH, height)
+        push = QRect(
+            left + self.PROGRESS_WIDTH + self.SPACING, top, self.BUTTON_WIDTH, height
+        )
+        return download, push
+
+    def _draw_button(self, painter, option, rect: QRect, icon: QIcon):
+        button = QStyleOptionButton()
+        button.rect = rect
+        button.icon = icon
+        button.iconSize = self.ICON_SIZE
+        button.state = option.state | QStyle.State_Enabled | QStyle.State_Raised
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        download, push = self._rects(option.rect)
+        progress = index.data(DownloadProgressRole)
+        if progress is None:
+            download.setWidth(self.BUTTON_WIDTH)
+            self._draw_button(painter, option, download, self._download_icon)
+        else:
+            bar = QStyleOptionProgressBar()
+            bar.rect = download
+            bar.minimum, bar.maximum, bar.progress = 0, 100, progress
+            bar.state = option.state | QStyle.State_Enabled
+            style = option.widget.style() if option.widget else QApplication.style()
+            style.drawControl(QStyle.CE_ProgressBar, bar, painter, option.widget)
+        self._draw_button(painter, option, push, self._push_icon)
+
+    def sizeHint(self, option, index):
+        return QSize(
+            self.PROGRESS_WIDTH + self.SPACING + self.BUTTON_WIDTH + 20,
+            super().sizeHint(option, index).height(),
+        )
+
+    def _hit(self, option, index, pos):
+        """Return which button of the cell is under pos, if any."""
+        download, push = self._rects(option.rect)
+        download.setWidth(self.BUTTON_WIDTH)
+        if push.contains(pos):
+            return "push"
+        if download.contains(pos) and index.data(DownloadProgressRole) is None:
+            return "download"
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+        ):
+            hit = self._hit(option, index, event.position().toPoint())
+            if hit == "download":
+                self.download_clicked.emit(index.row())
+                return True
+            if hit == "push":
+                self.push_clicked.emit(index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            hit = self._hit(option, index, event.pos())
+            if hit:
+                text = "Download build" if hit == "download" else "Push to Azure"
+                QToolTip.showText(event.globalPos(), text, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
 
 class BuildView(QWidget):
     """View for displaying and managing mobile builds."""
@@ -47,24 +331,28 @@ class BuildView(QWidget):
 
     def _create_widgets(self):
         """Create UI widgets."""
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels(
-            [
-                "Build ID",
-                "Version",
-                "Version Code",
-                "Channel",
-                "Status",
-                "Date",
-                "Actions",
-            ]
-        )
+        self._model = BuildTableModel(parent=self)
+        self._actions_delegate = BuildActionsDelegate(self)
+        self.table = QTableView()
+        self.table.setModel(self._model)
+        self.table.setItemDelegateForColumn(ACTIONS_COLUMN, self._actions_delegate)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate(BUILD_COLUMN_WIDTHS):
+            self.table.setColumnWidth(column, width)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
 
+        # Covers the rows while builds are fetched, so loading never touches the
+        # model and the table is only reset once, when the builds arrive
+        self._loading_overlay = QLabel("Loading...")
+        self._loading_overlay.setAlignment(Qt.AlignCenter)
+        self._loading_overlay.setAutoFillBackground(True)
+        self._loading_overlay.hide()
+        overlay_layout = QVBoxLayout(self.table.viewport())
+        overlay_layout.setContentsMargins(0, 0, 0, 0)
+        overlay_layout.addWidget(self._loading_overlay)
+
     def _setup_layout(self):
         """Set up the layout."""
         self._layout.addWidget(self.table)
@@ -72,21 +360,29 @@ class BuildView(QWidget):
     def _setup_connections(self):
         """Set up signal-slot connections."""
         self.table.doubleClicked.connect(self._on_row_double_clicked)
+        self._actions_delegate.download_clicked.connect(self._on_download_clicked)
+        self._actions_delegate.push_clicked.connect(self._on_push_clicked)
 
     def show_loading(self):
         """Display a loading indicator in the table."""
-        self.table.setRowCount(1)
-        self.table.setSpan(0, 0, 1, self.table.columnCount())
-        loading_item = QTableWidgetItem("Loading...")
-        loading_item.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(0, 0, loading_item)
+        self._loading_overlay.show()
         self.table.setEnabled(False)
 
     def hide_loading(self):
         """Hide the loading indicator and re-enable the table."""
-        self.table.setRowCount(0)
+        self._loading_overlay.hide()
         self.table.setEnabled(True)
 
+    @Slot(int)
+    def _on_download_clicked(self, row: int):
+        """Request a download of the build in a row."""
+        self.download_requested.emit(self._model.buildId(row))
+
+    @Slot(int)
+    def _on_push_clicked(self, row: int):
+        """Request a push to Azure of the build in a row."""
+        self.push_to_azure_requested.emit(self._model.buildId(row))
+
     def _on_row_double_clicked(self, index):
         """Handle double-clicking a row."""
         # Placeholder for future implementation
@@ -138,116 +434,37 @@ class BuildView(QWidget):
     @Slot(list)
     def update_builds(self, builds: list):
         """Update the table with new build data."""
-        self.hide_loading()
-        self.table.setRowCount(len(builds))
-        for row, build in enumerate(builds):
-            self._populate_row(row, build)
-        self.table.resizeRowsToContents()
-        self.table.resizeColumnsToContents()
-        # Ensure the 'Actions' column has enough space for buttons
-        self.table.setColumnWidth(6, 200)
-
-    def _populate_row(self, row: int, build: dict):
-        """Populate a single row in the table."""
-        self.table.setItem(row, 0, QTableWidgetItem(build.get("id")))
-
-        version_info = build.get("appVersion", "N/A")
-        self.table.setItem(row, 1, QTableWidgetItem(version_info))
-
-        version_code = build.get("appBuildVersion", "N/A")
-        self.table.setItem(row, 2, QTableWidgetItem(version_code))
-
-        self.table.setItem(row, 3, QTableWidgetItem(build.get("channel", "N/A")))
-        self.table.setItem(row, 4, QTableWidgetItem(build.get("status", "N/A")))
-
-        date_str = build.get("createdAt", "")
-        if date_str:
-            date_obj = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            date_str = date_obj.strftime("%Y-%m-%d %H:%M:%S")
-        self.table.setItem(row, 5, QTableWidgetItem(date_str))
-
-        self._add_action_buttons(row, build.get("id"))
-
-    def _add_action_buttons(self, row: int, build_id: str):
-        """Add action buttons to a row."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(5, 0, 5, 0)
-        layout.setSpacing(10)
-
-        # Stacked widget for download button and progress bar
-        download_stack = QStackedWidget()
-        download_stack.setFixedWidth(120)
-        download_btn = QPushButton()
-        download_btn.setIcon(QIcon(":/icons/download.svg"))
-        download_btn.setToolTip("Download build")
-        download_btn.setFixedWidth(40)
-        download_btn.clicked.connect(lambda: self.download_requested.emit(build_id))
-        download_stack.addWidget(download_btn)
-
-        progress_bar = QProgressBar()
-        progress_bar.setRange(0, 100)
-        progress_bar.setValue(0)
-        progress_bar.setTextVisible(False)
-        download_stack.addWidget(progress_bar)
-
-        layout.addStretch()
-        layout.addWidget(download_stack)
-
-        # Push to Azure button
-        push_btn = QPushButton()
-        push_btn.setIcon(QIcon(":/icons/upload.svg"))
-        push_btn.setToolTip("Push to Azure")
-        push_btn.setFixedWidth(40)
-        push_btn.clicked.connect(lambda: self.push_to_azure_requested.emit(build_id))
-        layout.addWidget(push_btn)
-        layout.addStretch()
-
-        widget.setLayout(layout)
-        self.table.setCellWidget(row, 6, widget)
+        # Fill the first batch of rows before letting the table repaint
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.hide_loading()
+            self._model.setBuilds(builds)
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     def show_download_progress(self, build_id: str):
         """Show a progress bar for a specific build."""
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == build_id:
-                widget = self.table.cellWidget(row, 6)
-                if widget:
-                    stack = widget.findChild(QStackedWidget)
-                    if stack:
-                        stack.setCurrentIndex(1)
-                        return
+        row = self._model.findRow(build_id)
+        if row is not None:
+            self._model.setDownloadProgress(row, 0)
 
     def update_download_progress(self, build_id: str, value: int):
         """Update the progress bar for a specific build."""
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == build_id:
-                widget = self.table.cellWidget(row, 6)
-                if widget:
-                    stack = widget.findChild(QStackedWidget)
-                    if stack and stack.currentIndex() == 1:
-                        progress_bar = stack.widget(1)
-                        if isinstance(progress_bar, QProgressBar):
-                            progress_bar.setValue(value)
-                        return
+        row = self._model.findRow(build_id)
+        if row is not None and self._model.downloadProgress(row) is not None:
+            self._model.setDownloadProgress(row, value)
 
     def hide_download_progress(self, build_id: str):
         """Hide the progress bar and show the download button."""
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).text() == build_id:
-                widget = self.table.cellWidget(row, 6)
-                if widget:
-                    stack = widget.findChild(QStackedWidget)
-                    if stack:
-                        stack.setCurrentIndex(0)  # Index of the download button
-                        return
+        row = self._model.findRow(build_id)
+        if row is not None:
+            self._model.setDownloadProgress(row, None)
 
     def _format_size(self, size_bytes: int) -> str:
         """Format size in bytes to human readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} PB"
+        # Each unit covers ten more bits of the size
+        tier = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * tier)):.1f} {SIZE_UNITS[tier]}"
 
     def show_error(self, message: str):
         """Show an error message dialog."""
@@ -255,35 +472,19 @@ class BuildView(QWidget):
 
     def update_build_status(self, build_id: str, status: str):
         """Update the status of a specific build in the table."""
-        try:
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 0).text() == build_id:
-                    self.table.item(row, 4).setText(status)
-                    break
-        except Exception as e:
-            logger.error(f"Error updating build status: {e}")
+        row = self._model.findRow(build_id)
+        if row is not None:
+            self._model.setStatus(row, status)
 
     def update_upload_status(self, build_id: str, status: str):
         """Update upload status for a build."""
-        try:
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 0).text() == build_id:
-                    # Update status column with upload info
-                    current_status = self.table.item(row, 4).text()
-                    self.table.item(row, 4).setText(f"{current_status} - {status}")
-                    break
-        except Exception as e:
-            logger.error(f"Error updating upload status: {e}")
+        row = self._model.findRow(build_id)
+        if row is not None:
+            # Update status column with upload info
+            self._model.setStatus(row, f"{self._model.status(row)} - {status}")
 
     def update_upload_retry(self, build_id: str, attempt: int):
         """Update upload retry information."""
-        try:
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 0).text() == build_id:
-                    current_status = self.table.item(row, 4).text()
-                    self.table.item(row, 4).setText(
-                        f"{current_status} - Retry {attempt}"
-                    )
-                    break
-        except Exception as e:
-            logger.error(f"Error updating upload retry: {e}")
+        row = self._model.findRow(build_id)
+        if row is not None:
+            self._model.setStatus(row, f"{self._model.status(row)} - Retry {attempt}")
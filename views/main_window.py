@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import List
 
 from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QAction, QColor
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -43,6 +43,9 @@ from .history_dialog import HistoryDialog
 
 logger = logging.getLogger(__name__)
 
+# Delay between the last keystroke in the search box and filtering the builds
+SEARCH_DEBOUNCE_MS = 200
+
 
 class StatusIndicator(QLabel):
     """Custom widget for displaying health status."""
@@ -54,13 +57,12 @@ class StatusIndicator(QLabel):
 
     def set_status(self, is_healthy: bool) -> None:
         """Set the status indicator color."""
-        color = (
-            QColor("#28a745") if is_healthy else QColor("#dc3545")
-        )  # Bootstrap success/danger colors
+        # Bootstrap success/danger colors
+        color = "#28a745" if is_healthy else "#dc3545"
         self.setStyleSheet(
             f"""
             QLabel {{
-                background-color: {color.name()};
+                background-color: {color};
                 border-radius: 6px;
                 border: 1px solid #dee2e6;
             }}
@@ -346,6 +348,11 @@ class MainWindow(QMainWindow):
         )
         controls_layout.addWidget(self.search_input, 1)  # Give it more space
 
+        # Filter once typing pauses rather than on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
         # Version filter
         version_label = QLabel("Version:")
         version_label.setStyleSheet(
@@ -483,7 +490,8 @@ class MainWindow(QMainWindow):
         """Connect all signals after UI and controllers are initialized."""
         # UI component signals
         self.refresh_button.clicked.connect(self.refresh_builds)
-        self.search_input.textChanged.connect(self._on_search_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._on_search_changed)
         self.version_filter.currentIndexChanged.connect(self._on_search_changed)
 
         # Menu actions
@@ -740,15 +748,21 @@ class MainWindow(QMainWindow):
         if not self.all_versions:
             self._adjust_window_size()
 
-        if not current_versions.issubset(self.all_versions):
-            self.all_versions.update(current_versions)
-
-            # Repopulate the dropdown
-            self.version_filter.clear()
-            self.version_filter.addItem("All Versions", "")
-            sorted_versions = sorted(list(self.all_versions), reverse=True)
-            for version in sorted_versions:
-                self.version_filter.addItem(version, version)
+        new_versions = current_versions - self.all_versions
+        if new_versions:
+            self.all_versions.update(new_versions)
+            sorted_versions = sorted(self.all_versions, reverse=True)
+
+            # Insert only the new versions at their sorted positions, keeping the
+            # selection and not re-filtering while the items shift
+            self.version_filter.blockSignals(True)
+            try:
+                for version in sorted(new_versions, reverse=True):
+                    # Index 0 is "All Versions"
+                    index = sorted_versions.index(version) + 1
+                    self.version_filter.insertItem(index, version, version)
+            finally:
+                self.version_filter.blockSignals(False)
 
     def _handle_builds_fetched(self, builds):
         """Handle fetched builds."""